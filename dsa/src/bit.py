@@ -1,3 +1,10 @@
+import array
+import operator
+from typing import cast
+
+from .packing import pack
+
+
 class BIT:
     """
     Binary Index Tree implementation.
@@ -8,11 +15,16 @@ class BIT:
     - `n`: size of `array` parameter
     """
 
+    __slots__ = ("_tree",)
+
     def __init__(self, array: list[float]):
         """
         Initialize the BIT.
         `array` is assumed to be zero-based, so a new array has to be created to allow fast index computation based only
         on bitwise operations.
+        The tree is built one lsb level at a time, from the lowest to the highest, with slices of the array.
+        The tree is packed with `pack` when all values are `int` or all are `float`, it is unpacked back to a list if a
+        later value does not fit the array (a non `int` value in an `int` tree, or an `int` larger than 64 bits).
         All function index parameters however, assume to be zero-based, functions will automatically increment indices.
 
         > complexity
@@ -23,28 +35,23 @@ class BIT:
         > parameters
         - `array`: base array for building the tree
         """
-        self._tree = [0.0] + array
-        for index in range(1, len(self._tree)):
-            if (parent := index + self._lsb(index)) < len(self._tree):
-                self._tree[parent] += self._tree[index]
+        tree = [0] + array
+        length = len(tree)
+        # indices with the same lsb are independent, each level adds all its nodes to their parents in one slice
+        # (deriving nodes as `prefix[i] - prefix[i - lsb(i)]` from `itertools.accumulate` was measured slower, and loses
+        # precision for floats)
+        step = 1
+        while step < length:
+            tree[step * 2 :: step * 2] = map(operator.add, tree[step * 2 :: step * 2], tree[step :: step * 2])
+            step *= 2
+        self._tree = pack(tree, 1)
 
     def __str__(self) -> str:
-        return f"BIT {self._tree}"
+        return f"BIT {[*self._tree]}"
 
     def __len__(self) -> int:
         return len(self._tree) - 1
 
-    def _lsb(self, value: int) -> int:
-        """
-        Compute the least significant bit of `value`.
-
-        > parameters
-        - `value: int`: value to compute lsb
-
-        - `return`: lsb of `value`
-        """
-        return value & -value
-
     def sum(self, index: int) -> float:
         """
         Return the prefix sum [0, `index`] in the original array (zero-based).
@@ -60,10 +67,11 @@ class BIT:
         - `return`: the sum
         """
         index += 1  # change index base to 1 (if not incremented, the sum range is open at index)
+        tree = self._tree
         acc = 0
         while index > 0:
-            acc += self._tree[index]
-            index -= self._lsb(index)
+            acc += tree[index]
+            index -= index & -index  # drop the lsb
         return acc
 
     def sum_range(self, from_index: int, to_index: int) -> float:
@@ -99,9 +107,17 @@ class BIT:
         - `return`: the sum
         """
         index += 1
-        while index < len(self._tree):
-            self._tree[index] += value
-            index += self._lsb(index)
+        tree = self._tree
+        if isinstance(tree, array.array) and tree.typecode == "q" and type(value) is not int:
+            self._tree = tree = tree.tolist()
+        length = len(tree)
+        while index < length:
+            try:
+                tree[index] += value
+            except OverflowError:
+                self._tree = tree = cast(array.array, tree).tolist()
+                continue
+            index += index & -index  # carry the lsb
 
     def set(self, index: int, value: float):
         """
@@ -9,17 +9,24 @@ class Linked(Generic[T], abc.ABC):
     Abstract base class for linear data structures.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
-        return f"{type(self).__name__} {str([*self])}"
+        # unpacking drives `__iter__` from C and the list repr joins values in C, `", ".join(map(repr, self))` is slower
+        return f"{type(self).__name__} {[*self]}"
 
     @abc.abstractmethod
-    def __len__(self) -> int:
-        ...
+    def __len__(self) -> int: ...
 
     @abc.abstractmethod
     def __iter__(self) -> Generator[T, None, None]:
         """
         Return a generator or values contained in the linked structure.
+        Linked (node and slot based) structures may be modified while the generator is suspended: the next link of the
+        last yielded value is read when the generator resumes, so values inserted or deleted after it are reflected,
+        and if it was deleted itself, its link at the time of the deletion is followed. Deleted nodes and slots are not
+        recycled while a generator is live, so a generator never yields a value from a reused node.
+        Array and deque based structures follow their storage and must not be modified during the iteration.
 
         > complexity
         - see implementations
@@ -41,7 +48,10 @@ class Linked(Generic[T], abc.ABC):
         - `value`: value to check
         - `return`: if value exists
         """
-        return any(value is v or value == v for v in self)
+        for v in self:
+            if value is v or value == v:
+                return True
+        return False
 
     def index(self, value: T):
         """
@@ -0,0 +1,392 @@
+import array
+import itertools
+from typing import Generator, Generic, Optional, cast
+
+from .abc import Linked, T
+
+
+class ArrayLinkedList(Generic[T], Linked[T]):
+    """
+    Doubly Linked List implementation backed by parallel arrays.
+    Nodes are integer slots, `_next` and `_prev` are packed `array.array` buffers of slot indices and `_values` stores
+    the value of each slot, `-1` is used as the null index. Deleted slots are kept in a free list and reused by
+    later insertions, slots deleted while an iterator is live are kept in `_released` and only freed when the last
+    iterator finishes. Links are plain integers, so they are not traced by the garbage collector and a traversal reads
+    contiguous memory instead of chasing node objects.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: largest number of elements in the structure at the same time
+    """
+
+    __slots__ = ("_values", "_next", "_prev", "_free", "_released", "_iterators", "_head", "_tail", "_length")
+
+    def __init__(self):
+        super().__init__()
+        self._values: list[Optional[T]] = []
+        self._next = array.array("q")
+        self._prev = array.array("q")
+        self._free: list[int] = []
+        self._released: list[int] = []
+        self._iterators = 0
+        self._head = -1
+        self._tail = -1
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Generator[T, None, None]:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+        """
+        values, next = self._values, self._next
+        self._iterators += 1
+        try:
+            i = self._head
+            while i != -1:
+                yield cast(T, values[i])
+                i = next[i]
+        finally:
+            self._finish_iteration()
+
+    def __reversed__(self) -> Generator[T, None, None]:
+        """
+        Return a generator of values from the end to the beginning of the list, following the `prev` links.
+        `reverse` swaps the link arrays, so both traversal directions stay valid after any number of reversals.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+        """
+        values, prev = self._values, self._prev
+        self._iterators += 1
+        try:
+            i = self._tail
+            while i != -1:
+                yield cast(T, values[i])
+                i = prev[i]
+        finally:
+            self._finish_iteration()
+
+    def __contains__(self, value: T) -> bool:
+        """
+        Check base class.
+        Values other than `None` are checked with a C-level scan of the values list, free slots store `None`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: largest number of elements in the structure at the same time
+        """
+        if value is not None:
+            return value in self._values
+        return self._slot_value(value) != -1
+
+    def _finish_iteration(self):
+        """
+        Count the end of an iteration, when the last live iterator finishes, the released slots are freed.
+
+        > complexity
+        - time: `O(r)`
+        - space: `O(1)`
+        - `r`: number of slots deleted during the iterations
+        """
+        self._iterators -= 1
+        if self._iterators == 0 and self._released:
+            self._free.extend(self._released)
+            self._released.clear()
+
+    def _slot_index(self, index: int) -> int:
+        """
+        Get the slot at `index`, or raise exception if index is invalid.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+
+        > parameters
+        - `index`: node index
+        - `return`: slot at `index`
+        """
+        if index < 0 or index >= self._length:
+            raise IndexError(f"index ({index}) out of range [0, {self._length})")
+        if index < self._length >> 1:
+            next = self._next
+            i = self._head
+            for _ in itertools.repeat(None, index):
+                i = next[i]
+        else:
+            prev = self._prev
+            i = self._tail
+            for _ in itertools.repeat(None, self._length - 1 - index):
+                i = prev[i]
+        return i
+
+    def _slot_value(self, value: T) -> int:
+        """
+        Get the first slot that contains `value`, or `-1` if `value` is not found.
+        Misses are a regular result for `__contains__`, so no exception is created for them.
+        Values are stored in a flat list, so missing and unique values are resolved by C-level `list.count` and
+        `list.index` scans, only repeated values need to walk the links to find the first one in list order. Free slots
+        store `None`, so searching `None` always walks the links.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+
+        > parameters
+        - `value`: node value
+        - `return`: slot containing `value`, or `-1`
+        """
+        values, next = self._values, self._next
+        if value is not None:
+            count = values.count(value)
+            if count == 0:
+                return -1
+            if count == 1:
+                return values.index(value)
+        i = self._head
+        while i != -1 and values[i] is not value and values[i] != value:
+            i = next[i]
+        return i
+
+    def _insert(self, index: int, value: T):
+        """
+        Take a slot from the free list, or append a new one, and insert it with `value` in the specified `index`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)` amortized
+        - `n`: length of the list
+
+        > parameters
+        - `index`: insertion index
+        - `value`: value to insert
+        """
+        if index < 0 or index > self._length:
+            raise IndexError(f"index ({index}) out of range [0, {self._length}]")
+        next, prev = self._next, self._prev
+        if self._free:
+            i = self._free.pop()
+            self._values[i] = value
+        else:
+            i = len(self._values)
+            self._values.append(value)
+            next.append(-1)
+            prev.append(-1)
+        if self._head == -1:
+            next[i] = prev[i] = -1
+            self._head = self._tail = i
+        elif index == 0:
+            next[i] = self._head
+            prev[i] = -1
+            prev[self._head] = i
+            self._head = i
+        elif index == self._length:
+            next[i] = -1
+            prev[i] = self._tail
+            next[self._tail] = i
+            self._tail = i
+        else:
+            current = self._slot_index(index)
+            next[i] = current
+            prev[i] = prev[current]
+            next[prev[current]] = prev[current] = i
+        self._length += 1
+
+    def _delete(self, i: int) -> T:
+        """
+        Delete the received slot `i` from the data structure, the slot is returned to the free list, or to the released
+        list while an iterator is live, its links are kept so the iterator can continue from it.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `i`: slot to delete
+        - `return`: value from the deleted slot
+        """
+        next, prev = self._next, self._prev
+        if prev[i] != -1:
+            next[prev[i]] = next[i]
+        else:
+            self._head = next[i]
+        if next[i] != -1:
+            prev[next[i]] = prev[i]
+        else:
+            self._tail = prev[i]
+        self._length -= 1
+        value = cast(T, self._values[i])
+        self._values[i] = None
+        (self._released if self._iterators else self._free).append(i)
+        return value
+
+    def push(self, value: T, index: Optional[int] = None):
+        """
+        Insert `value` at the end of the list.
+        If `index` is provided, then insert at `index`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)` amortized
+        - `n`: length of the list
+
+        > parameters
+        - `value`: value to insert
+        - `index`: insertion index
+        """
+        self._insert(index if index is not None else self._length, value)
+
+    def pop(self, index: Optional[int] = None) -> T:
+        """
+        Delete the value at the end of the list.
+        If `index` is provided, then delete at `index`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+
+        > parameters
+        - `index`: deletion index
+        - `return`: value from the deleted slot
+        """
+        return self._delete(self._slot_index(index if index is not None else self._length - 1))
+
+    def remove(self, value: T) -> T:
+        """
+        Remove the first slot that contains `value`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+
+        > parameters
+        - `value`: value to remove
+        - `return`: value from the deleted slot
+        """
+        i = self._slot_value(value)
+        if i == -1:
+            raise ValueError(f"value ({value}) not found")
+        return self._delete(i)
+
+    def get(self, index: Optional[int] = None) -> T:
+        """
+        Get the value at the end of the list.
+        If `index` is provided, then get at `index`.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+
+        > parameters
+        - `index`: value index
+        - `return`: value at `index`
+        """
+        return cast(T, self._values[self._slot_index(index if index is not None else self._length - 1)])
+
+    def reverse(self):
+        """
+        Reverse the list by swapping the link arrays, `next` links become `prev` links and vice versa.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+        """
+        self._next, self._prev = self._prev, self._next
+        self._head, self._tail = self._tail, self._head
+
+
+def test():
+    from ..test import benchmark, verify
+    from .list import LinkedList
+
+    array_list = ArrayLinkedList[int]()
+    verify(
+        (
+            (array_list.push, (2, 0)),
+            (array_list.push, (1, 0)),
+            (array_list.push, (0, 0)),
+            (array_list.push, (5,)),
+            (array_list.push, (6,)),
+            (array_list.push, (7,)),
+            (array_list.push, (3, 3)),
+            (array_list.push, (4, 4)),
+            (print, (array_list,)),
+            (array_list.get, (6,), 6),
+            (array_list.get, (2,), 2),
+            (array_list.pop, (4,), 4),
+            (array_list.pop, (3,), 3),
+            (print, (array_list,)),
+            (array_list.pop, (), 7),
+            (array_list.pop, (0,), 0),
+            (print, (array_list,)),
+            (array_list.reverse, ()),
+            (array_list.index, (5,), 1),
+            (array_list.index, (2,), 2),
+            (array_list.remove, (5,), 5),
+            (array_list.push, (8, 1)),
+            (print, (array_list,)),
+            (print, ([*reversed(array_list)],)),
+        )
+    )
+
+    def iterate_modifying(array_list: ArrayLinkedList[int]) -> list[int]:
+        values = []
+        for value in array_list:
+            values.append(value)
+            if value == 0:
+                array_list.pop(1)
+                array_list.push(99)
+        return values
+
+    array_list = ArrayLinkedList[int]()
+    for i in range(5):
+        array_list.push(i)
+    verify(((iterate_modifying, (array_list,), [0, 2, 3, 4, 99]),))
+
+    def test_linked_list(count: int):
+        linked_list = LinkedList[int]()
+        for i in range(count):
+            linked_list.push(i)
+        for i in range(0, count, max(count // 100, 1)):
+            linked_list.get(i)
+        for i in range(count // 2):
+            linked_list.pop()
+            linked_list.pop(0)
+
+    def test_array_linked_list(count: int):
+        array_list = ArrayLinkedList[int]()
+        for i in range(count):
+            array_list.push(i)
+        for i in range(0, count, max(count // 100, 1)):
+            array_list.get(i)
+        for i in range(count // 2):
+            array_list.pop()
+            array_list.pop(0)
+
+    benchmark(
+        (
+            ("       linked list", test_linked_list),
+            (" array linked list", test_array_linked_list),
+        ),
+        test_inputs=(),
+        bench_sizes=(0, 1, 10, 100, 1000, 10000, 100000),
+        bench_input=lambda s: s,
+    )
+
+
+if __name__ == "__main__":
+    test()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Generator, Generic, Optional, cast
+import itertools
+from typing import Generator, Generic, Iterable, Optional, cast
 
 from .abc import Linked, T
+from .pool import NodePool
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Node(Generic[T]):
     value: T
     prev: Optional[Node[T]] = None
@@ -16,17 +18,58 @@ class Node(Generic[T]):
 class LinkedList(Generic[T], Linked[T]):
     """
     Doubly Linked List implementation.
+    Every `EXPRESS_STRIDE`-th node is kept in an express pointer array, so positional accesses jump to the closest
+    express node before the index and walk less than `EXPRESS_STRIDE` nodes from there. Appending at the end keeps the
+    express array up to date, other modifications discard it and it is rebuilt on the next positional access.
+    `reverse` only flips a direction flag, nodes keep their physical order and logical positions are mapped to it.
 
     > complexity
-    - space: `O(n)`
+    - space: `O(n + n/b)`
     - `n`: number of elements in the structure
+    - `b`: `EXPRESS_STRIDE`
     """
 
+    EXPRESS_STRIDE = 8
+
+    __slots__ = ("_pool", "_head", "_tail", "_length", "_express", "_reversed")
+
     def __init__(self):
         super().__init__()
+        self._pool = NodePool[Node[T]](lambda: Node(cast(T, None)))
         self._head: Optional[Node[T]] = None
         self._tail: Optional[Node[T]] = None
         self._length = 0
+        self._express: Optional[list[Node[T]]] = []
+        self._reversed = False
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> LinkedList[T]:
+        """
+        Build a list containing all values from `iterable`, in order.
+        All nodes are allocated in a single batch and linked in one pass, which is faster than calling `push` for each
+        value.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(n)`
+        - `n`: length of `iterable`
+
+        > parameters
+        - `iterable`: values to insert
+        - `return`: new list
+        """
+        linked_list = cls()
+        nodes = [Node(value) for value in iterable]
+        if len(nodes) == 0:
+            return linked_list
+        for i in range(len(nodes) - 1):
+            nodes[i].next = nodes[i + 1]
+            nodes[i + 1].prev = nodes[i]
+        linked_list._head = nodes[0]
+        linked_list._tail = nodes[-1]
+        linked_list._length = len(nodes)
+        linked_list._express = nodes[:: cls.EXPRESS_STRIDE]
+        return linked_list
 
     def __len__(self) -> int:
         return self._length
@@ -34,25 +77,74 @@ class LinkedList(Generic[T], Linked[T]):
     def __iter__(self) -> Generator[T, None, None]:
         """
         Check base class.
+        Values are yielded one at a time, collecting chunks of values to chain them is slower because the chunk loop
+        costs more than resuming the generator.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the list
+        """
+        pool = self._pool
+        pool.iterators += 1
+        try:
+            if self._reversed:
+                cursor = self._tail
+                while cursor is not None:
+                    yield cursor.value
+                    cursor = cursor.prev
+            else:
+                cursor = self._head
+                while cursor is not None:
+                    yield cursor.value
+                    cursor = cursor.next
+        finally:
+            pool.iterators -= 1
+
+    def __contains__(self, value: T) -> bool:
+        """
+        Check base class.
+        Nodes are walked directly instead of through the `__iter__` generator.
 
         > complexity
         - time: `O(n)`
         - space: `O(1)`
         - `n`: length of the list
         """
+        return self._node_value(value) is not None
+
+    def _build_express(self) -> list[Node[T]]:
+        """
+        Rebuild the express pointer array with every `EXPRESS_STRIDE`-th node.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(n/b)`
+        - `n`: length of the list
+        - `b`: `EXPRESS_STRIDE`
+
+        - `return`: express pointer array
+        """
+        express = self._express = []
         cursor = self._head
         while cursor is not None:
-            yield cursor.value
-            cursor = cursor.next
+            express.append(cursor)
+            for _ in itertools.repeat(None, self.EXPRESS_STRIDE):
+                cursor = cursor.next
+                if cursor is None:
+                    break
+        return express
 
     def _node_index(self, index: int) -> Node[T]:
         """
         Get the node at `index`, or raise exception if index is invalid.
+        `index` is mapped to the physical position of the node if the list is reversed.
 
         > complexity
-        - time: `O(n)`
+        - time: `O(n)` if the express pointer array has to be rebuilt, `O(b)` otherwise
         - space: `O(1)`
         - `n`: length of the list
+        - `b`: `EXPRESS_STRIDE`
 
         > parameters
         - `index`: node index
@@ -60,15 +152,20 @@ class LinkedList(Generic[T], Linked[T]):
         """
         if index < 0 or index >= self._length:
             raise IndexError(f"index ({index}) out of range [0, {self._length})")
-        forward = index < self._length / 2
-        cursor = cast(Node[T], self._head if forward else self._tail)
-        for _ in range(index if forward else (self._length - 1 - index)):
-            cursor = cast(Node[T], cursor.next if forward else cursor.prev)
+        if self._reversed:
+            index = self._length - 1 - index
+        express = self._express if self._express is not None else self._build_express()
+        # each loop hop is a single attribute load, `repeat` avoids creating ints
+        bucket, steps = divmod(index, self.EXPRESS_STRIDE)
+        cursor = express[bucket]
+        for _ in itertools.repeat(None, steps):
+            cursor = cursor.next  # type: ignore
         return cursor
 
-    def _node_value(self, value: T) -> Node[T]:
+    def _node_value(self, value: T) -> Optional[Node[T]]:
         """
-        Get the first node that contains`value`, or raise exception if `value` is not found.
+        Get the first node that contains `value`, or `None` if `value` is not found.
+        Misses are a regular result for `__contains__`, so no exception is created for them.
 
         > complexity
         - time: `O(n)`
@@ -77,18 +174,22 @@ class LinkedList(Generic[T], Linked[T]):
 
         > parameters
         - `value`: node value
-        - `return`: node containing `value`
+        - `return`: node containing `value`, or `None`
         """
-        cursor = self._head
-        while cursor is not None and cursor.value is not value and cursor.value != value:
-            cursor = cursor.next
-        if cursor is None:
-            raise ValueError(f"value ({value}) not found")
+        if self._reversed:
+            cursor = self._tail
+            while cursor is not None and cursor.value is not value and cursor.value != value:
+                cursor = cursor.prev
+        else:
+            cursor = self._head
+            while cursor is not None and cursor.value is not value and cursor.value != value:
+                cursor = cursor.next
         return cursor
 
     def _insert(self, index: int, value: T):
         """
-        Create and insert a new node with `value` in the specified `index`.
+        Take a node from the node pool and insert it with `value` in the specified `index`.
+        Insertions at the ends are forwarded to `push_front` and `push_back`.
 
         > complexity
         - time: `O(n)`
@@ -101,23 +202,27 @@ class LinkedList(Generic[T], Linked[T]):
         """
         if index < 0 or index > self._length:
             raise IndexError(f"index ({index}) out of range [0, {self._length}]")
-        if self._head is None:
-            self._head = self._tail = Node(value)
-        elif index == 0:
-            self._head = Node(value, None, self._head)
-            cast(Node[T], self._head.next).prev = self._head
-        elif index == self._length:
-            self._tail = Node(value, self._tail, None)
-            cast(Node[T], self._tail.prev).next = self._tail
-        else:
-            current = self._node_index(index)
-            node = Node(value, current.prev, current)
-            cast(Node[T], node.prev).next = cast(Node[T], node.next).prev = node
+        if index == 0:
+            return self.push_front(value)
+        if index == self._length:
+            return self.push_back(value)
+        current = self._node_index(index)
+        if self._reversed:
+            # the node at `index` of the reversed list is physically preceded by the new node
+            current = cast(Node[T], current.next)
+        node = self._pool.pop() if self._pool else self._pool.allocate()
+        node.value = value
+        node.prev = current.prev
+        node.next = current
+        cast(Node[T], node.prev).next = current.prev = node
         self._length += 1
+        self._express = None
 
     def _delete(self, node: Node[T]) -> T:
         """
-        Delete the received `node` from the data structure.
+        Delete the received `node` from the data structure, the node is returned to the node pool, unless an iterator is
+        live (check `NodePool`).
+        Receiving `None` raises `AttributeError` before the list is modified, `pop_front` and `pop_back` rely on it.
 
         > complexity
         - time: `O(1)`
@@ -129,21 +234,139 @@ class LinkedList(Generic[T], Linked[T]):
         if node.prev is not None and node.next is not None:
             node.prev.next = node.next
             node.next.prev = node.prev
+            self._express = None
         elif node.next is not None:
             self._head = node.next
             self._head.prev = None
+            self._express = None
         elif node.prev is not None:
             self._tail = node.prev
             self._tail.next = None
+            if self._express is not None and self._express[-1] is node:
+                self._express.pop()
         else:
             self._head = self._tail = None
+            self._express = []
         self._length -= 1
-        return node.value
+        value = node.value
+        if not self._pool.iterators:
+            node.value = cast(T, None)
+            node.prev = node.next = None
+            self._pool.append(node)
+        return value
+
+    def _push_head(self, value: T):
+        """
+        Take a node from the node pool and link it with `value` before the physical head.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        node = self._pool.pop() if self._pool else self._pool.allocate()
+        node.value = value
+        node.next = self._head
+        if self._head is None:
+            self._tail = node
+        else:
+            self._head.prev = node
+        self._head = node
+        self._length += 1
+        self._express = None
+
+    def _push_tail(self, value: T):
+        """
+        Take a node from the node pool and link it with `value` after the physical tail.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        node = self._pool.pop() if self._pool else self._pool.allocate()
+        node.value = value
+        node.prev = self._tail
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
+        self._tail = node
+        if self._express is not None and self._length % self.EXPRESS_STRIDE == 0:
+            self._express.append(node)
+        self._length += 1
+
+    def push_front(self, value: T):
+        """
+        Insert `value` at the beginning of the list.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        if self._reversed:
+            self._push_tail(value)
+        else:
+            self._push_head(value)
+
+    def push_back(self, value: T):
+        """
+        Insert `value` at the end of the list.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        if self._reversed:
+            self._push_head(value)
+        else:
+            self._push_tail(value)
+
+    def pop_front(self) -> T:
+        """
+        Delete the value at the beginning of the list.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value from the deleted node
+        """
+        try:
+            return self._delete(self._tail if self._reversed else self._head)  # type: ignore
+        except AttributeError:
+            raise IndexError("empty list") from None
+
+    def pop_back(self) -> T:
+        """
+        Delete the value at the end of the list.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value from the deleted node
+        """
+        try:
+            return self._delete(self._head if self._reversed else self._tail)  # type: ignore
+        except AttributeError:
+            raise IndexError("empty list") from None
 
     def push(self, value: T, index: Optional[int] = None):
         """
         Insert `value` at the end of the list.
         If `index` is provided, then insert at `index`.
+        Insertions at the ends do not walk the list.
 
         > complexity
         - time: `O(n)`
@@ -154,12 +377,25 @@ class LinkedList(Generic[T], Linked[T]):
         - `value`: value to insert
         - `index`: insertion index
         """
-        self._insert(index if index is not None else self._length, value)
+        # end insertions are dispatched here instead of going through `push_front` and `push_back`, saving a call
+        if index is None or index == self._length:
+            if self._reversed:
+                self._push_head(value)
+            else:
+                self._push_tail(value)
+        elif index == 0:
+            if self._reversed:
+                self._push_tail(value)
+            else:
+                self._push_head(value)
+        else:
+            self._insert(index, value)
 
     def pop(self, index: Optional[int] = None) -> T:
         """
         Delete the value at the end of the list.
         If `index` is provided, then delete at `index`.
+        Deletions at the ends do not walk the list.
 
         > complexity
         - time: `O(n)`
@@ -170,7 +406,17 @@ class LinkedList(Generic[T], Linked[T]):
         - `index`: deletion index
         - `return`: value from the deleted node
         """
-        return self._delete(self._node_index(index if index is not None else self._length - 1))
+        # end deletions are resolved here instead of going through `pop_front` and `pop_back`, saving a call
+        if index is None or index == self._length - 1:
+            node = self._head if self._reversed else self._tail
+        elif index == 0:
+            node = self._tail if self._reversed else self._head
+        else:
+            node = self._node_index(index)
+        try:
+            return self._delete(node)  # type: ignore
+        except AttributeError:
+            raise IndexError("empty list") from None
 
     def remove(self, value: T) -> T:
         """
@@ -185,7 +431,10 @@ class LinkedList(Generic[T], Linked[T]):
         - `index`: deletion index
         - `return`: value from the deleted node
         """
-        return self._delete(self._node_value(value))
+        node = self._node_value(value)
+        if node is None:
+            raise ValueError(f"value ({value}) not found")
+        return self._delete(node)
 
     def get(self, index: Optional[int] = None) -> T:
         """
@@ -205,17 +454,13 @@ class LinkedList(Generic[T], Linked[T]):
 
     def reverse(self):
         """
-        Reverse the list nodes.
+        Reverse the list by flipping its direction flag, nodes and express pointers are not touched.
 
         > complexity
-        > time: `O(n)`
-        > space: `O(1)`
+        - time: `O(1)`
+        - space: `O(1)`
         """
-        node = cast(Node[T], self._head)
-        self._head, self._tail = self._tail, self._head
-        for _ in range(self._length):
-            node.prev, node.next = node.next, node.prev
-            node = cast(Node[T], node.prev)
+        self._reversed = not self._reversed
 
 
 def test():
@@ -259,9 +504,26 @@ def test():
             (linked_list.index, (5,), 1),
             (linked_list.index, (2,), 2),
             (print, (linked_list,)),
+            (linked_list.push_front, (9,)),
+            (linked_list.push_back, (8,)),
+            (print, (linked_list,)),
+            (linked_list.pop_front, (), 9),
+            (linked_list.pop_back, (), 8),
+            (print, (LinkedList[int].from_iterable(range(5)),)),
         )
     )
 
+    def iterate_modifying(linked_list: LinkedList[int]) -> list[int]:
+        values = []
+        for value in linked_list:
+            values.append(value)
+            if value == 0:
+                linked_list.pop(1)
+                linked_list.push(99)
+        return values
+
+    verify(((iterate_modifying, (LinkedList[int].from_iterable(range(5)),), [0, 2, 3, 4, 99]),))
+
     def test_linked_list(count: int):
         linked_list = LinkedList[int]()
         for i in range(count):
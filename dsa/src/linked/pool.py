@@ -0,0 +1,63 @@
+from typing import Callable, TypeVar
+
+N = TypeVar("N")
+
+
+class NodePool(list[N]):
+    """
+    Pool of reusable nodes for linked data structures.
+    Nodes are allocated in chunks and recycled through the pool, which is itself the free list, so most insertions
+    reuse an existing node instead of allocating a new object.
+
+    The pool is a `list` so data structures can take and return nodes with C-level `pop` and `append` calls in their
+    hot paths, only calling `allocate` when the pool is empty:
+    ```
+    node = pool.pop() if pool else pool.allocate()
+    ...
+    if not pool.iterators:
+        node.value = node.next = None  # drop references before returning the node
+        pool.append(node)
+    ```
+
+    `iterators` counts the live iterators of the data structure. An iterator may still hold a node deleted while it is
+    suspended, so nodes deleted while `iterators` is positive keep their links and are left to the garbage collector
+    instead of being cleared and recycled.
+
+    > complexity
+    - space: `O(n + c)`
+    - `n`: largest number of nodes in use at the same time
+    - `c`: chunk size
+    """
+
+    __slots__ = ("_factory", "_chunk", "iterators")
+
+    def __init__(self, factory: Callable[[], N], chunk: int = 64):
+        """
+        Initialize the pool, no nodes are allocated until the first `allocate`.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `factory`: function that creates an empty node
+        - `chunk`: number of nodes to allocate when the pool is empty
+        """
+        super().__init__()
+        self._factory = factory
+        self._chunk = max(chunk, 1)
+        self.iterators = 0
+
+    def allocate(self) -> N:
+        """
+        Fill the pool with a new chunk of nodes and take one of them.
+
+        > complexity
+        - time: `O(c)`
+        - space: `O(c)`
+        - `c`: chunk size
+
+        - `return`: empty node
+        """
+        self.extend([self._factory() for _ in range(self._chunk)])
+        return self.pop()
@@ -1,36 +1,166 @@
 from __future__ import annotations
 
-import dataclasses
-from typing import Generator, Generic, Optional
+import array
+import collections
+import itertools
+from typing import Generic, Iterator, Optional, cast
 
+from ..packing import ARRAY_TYPECODES
 from .abc import Linked, T
+from .singly import Node, SinglyLinked
 
 
-@dataclasses.dataclass
-class Node(Generic[T]):
-    value: T
-    next: Optional[Node[T]] = None
+class Queue(Generic[T], SinglyLinked[T]):
+    """
+    Linked queue implementation.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: number of elements in the structure
+    """
+
+    __slots__ = ("_tail",)
+
+    def __init__(self):
+        super().__init__(None)
+        self._tail: Optional[Node[T]] = None
+
+    @classmethod
+    def of(cls, value_type: type) -> Queue[T] | ArrayQueue[T]:
+        """
+        Create an empty queue specialized for `value_type`.
+        If `value_type` has an `array.array` typecode (`int` or `float`), an `ArrayQueue` is returned, otherwise a
+        `Queue`.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value_type`: type of the values to be stored
+        - `return`: new queue
+        """
+        typecode = ARRAY_TYPECODES.get(value_type)
+        return ArrayQueue[T](typecode) if typecode is not None else cls()
+
+    def offer(self, value: T):
+        """
+        Insert `value` at the end of the queue.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        node = self._pool.pop() if self._pool else self._pool.allocate()
+        node.value = value
+        if self._tail is None:
+            self._head = self._tail = node
+        else:
+            self._tail.next = node
+            self._tail = node
+        self._length += 1
+
+    def poll(self):
+        """
+        Delete the value at the begginging of the queue.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: deleted value
+        """
+        node = self._head
+        try:
+            value = node.value  # type: ignore
+        except AttributeError:
+            raise IndexError("empty queue") from None
+        self._head = node.next  # type: ignore
+        if self._head is None:
+            self._tail = None
+        if not self._pool.iterators:
+            node.value = cast(T, None)
+            node.next = None
+            self._pool.append(node)
+        self._length -= 1
+        return value
+
+    def poll_many(self, count: int) -> list[T]:
+        """
+        Delete `count` values from the beginning of the queue.
+        The deleted nodes are unlinked as a single chain and returned to the node pool with a single `extend`, unless an
+        iterator is live (check `NodePool`).
 
+        > complexity
+        - time: `O(c)`
+        - space: `O(c)`
+        - `c`: `count`
 
-class Queue(Generic[T], Linked[T]):
+        > parameters
+        - `count`: number of values to delete
+        - `return`: deleted values, in queue order
+        """
+        if count < 0 or count > self._length:
+            raise IndexError(f"count ({count}) out of range [0, {self._length}]")
+        values = list[T]()
+        nodes = list[Node[T]]()
+        recycle = not self._pool.iterators
+        cursor = self._head
+        for _ in itertools.repeat(None, count):
+            node = cast(Node[T], cursor)
+            cursor = node.next
+            values.append(node.value)
+            if recycle:
+                node.value = cast(T, None)
+                node.next = None
+                nodes.append(node)
+        self._head = cursor
+        if cursor is None:
+            self._tail = None
+        self._pool.extend(nodes)
+        self._length -= count
+        return values
+
+    def peek(self):
+        """
+        Get the value at the beggening of the queue without removing it.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value at the begginging of the queue
+        """
+        try:
+            return self._head.value  # type: ignore
+        except AttributeError:
+            raise IndexError("empty queue") from None
+
+
+class DequeQueue(Generic[T], Linked[T]):
     """
-    Linked queue implementation.
+    Queue implementation backed by `collections.deque`.
+    Same interface as `Queue`, but offer and poll are single calls into the C deque, which stores values in fixed size
+    blocks instead of allocating one node per value.
 
     > complexity
     - space: `O(n)`
     - `n`: number of elements in the structure
     """
 
+    __slots__ = ("_deque",)
+
     def __init__(self):
         super().__init__()
-        self._head: Optional[Node[T]] = None
-        self._tail: Optional[Node[T]] = None
-        self._length = 0
+        self._deque = collections.deque[T]()
 
     def __len__(self) -> int:
-        return self._length
+        return len(self._deque)
 
-    def __iter__(self) -> Generator[T, None, None]:
+    def __iter__(self) -> Iterator[T]:
         """
         Check base class.
 
@@ -39,10 +169,7 @@ class Queue(Generic[T], Linked[T]):
         - space: `O(1)`
         - `n`: length of the queue
         """
-        cursor = self._head
-        while cursor is not None:
-            yield cursor.value
-            cursor = cursor.next
+        return iter(self._deque)
 
     def offer(self, value: T):
         """
@@ -55,11 +182,116 @@ class Queue(Generic[T], Linked[T]):
         > parameters
         - `value`: value to insert
         """
-        if self._tail is None:
-            self._head = self._tail = Node(value)
-        else:
-            self._tail.next = Node(value)
-            self._tail = self._tail.next
+        self._deque.append(value)
+
+    def poll(self):
+        """
+        Delete the value at the begginging of the queue.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: deleted value
+        """
+        try:
+            return self._deque.popleft()
+        except IndexError:
+            raise IndexError("empty queue") from None
+
+    def poll_many(self, count: int) -> list[T]:
+        """
+        Delete `count` values from the beginning of the queue.
+
+        > complexity
+        - time: `O(c)`
+        - space: `O(c)`
+        - `c`: `count`
+
+        > parameters
+        - `count`: number of values to delete
+        - `return`: deleted values, in queue order
+        """
+        if count < 0 or count > len(self._deque):
+            raise IndexError(f"count ({count}) out of range [0, {len(self._deque)}]")
+        popleft = self._deque.popleft
+        return [popleft() for _ in itertools.repeat(None, count)]
+
+    def peek(self):
+        """
+        Get the value at the beggening of the queue without removing it.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value at the begginging of the queue
+        """
+        try:
+            return self._deque[0]
+        except IndexError:
+            raise IndexError("empty queue") from None
+
+
+class ArrayQueue(Generic[T], Linked[T]):
+    """
+    Queue implementation backed by a ring buffer in a typed `array.array`.
+    Values are stored unboxed, so every value must fit the array typecode, `int` values are limited to 64 bits.
+    The buffer doubles its capacity when full, unrolling the ring so the head is moved to the beginning.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: largest number of elements in the structure at the same time
+    """
+
+    __slots__ = ("_array", "_head", "_length")
+
+    def __init__(self, typecode: str):
+        """
+        > parameters
+        - `typecode`: `array.array` typecode of the values
+        """
+        super().__init__()
+        self._array = array.array(typecode)
+        self._head = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(n)`
+        - `n`: length of the queue
+        """
+        end = self._head + self._length
+        if end <= len(self._array):
+            return iter(self._array[self._head : end])  # type: ignore
+        return itertools.chain(self._array[self._head :], self._array[: end - len(self._array)])  # type: ignore
+
+    def offer(self, value: T):
+        """
+        Insert `value` at the end of the queue.
+
+        > complexity
+        - time: `O(1)` amortized
+        - space: `O(1)` amortized
+
+        > parameters
+        - `value`: value to insert
+        """
+        capacity = len(self._array)
+        if self._length == capacity:
+            self._array = self._array[self._head :] + self._array[: self._head]
+            self._array.extend(itertools.repeat(0, max(capacity, 8)))
+            self._head = 0
+            capacity = len(self._array)
+        end = self._head + self._length
+        self._array[end if end < capacity else end - capacity] = value  # type: ignore
         self._length += 1
 
     def poll(self):
@@ -72,15 +304,40 @@ class Queue(Generic[T], Linked[T]):
 
         - `return`: deleted value
         """
-        if self._head is None:
+        if self._length == 0:
             raise IndexError("empty queue")
-        value = self._head.value
-        self._head = self._head.next
-        if self._head is None:
-            self._tail = None
+        value = self._array[self._head]
+        self._head += 1
+        if self._head == len(self._array):
+            self._head = 0
         self._length -= 1
         return value
 
+    def poll_many(self, count: int) -> list[T]:
+        """
+        Delete `count` values from the beginning of the queue.
+
+        > complexity
+        - time: `O(c)`
+        - space: `O(c)`
+        - `c`: `count`
+
+        > parameters
+        - `count`: number of values to delete
+        - `return`: deleted values, in queue order
+        """
+        if count < 0 or count > self._length:
+            raise IndexError(f"count ({count}) out of range [0, {self._length}]")
+        capacity = len(self._array)
+        end = self._head + count
+        if end <= capacity:
+            values = self._array[self._head : end].tolist()
+        else:
+            values = self._array[self._head :].tolist() + self._array[: end - capacity].tolist()
+        self._head = end if end < capacity else end - capacity
+        self._length -= count
+        return values
+
     def peek(self):
         """
         Get the value at the beggening of the queue without removing it.
@@ -91,14 +348,12 @@ class Queue(Generic[T], Linked[T]):
 
         - `return`: value at the begginging of the queue
         """
-        if self._head is None:
+        if self._length == 0:
             raise IndexError("empty queue")
-        return self._head.value
+        return self._array[self._head]
 
 
 def test():
-    import collections
-
     from ..test import benchmark, verify
 
     queue = Queue[int]()
@@ -122,6 +377,55 @@ def test():
             (queue.poll, (), 4),
             (queue.poll, (), 5),
             (print, (queue,)),
+            (queue.offer, (6,)),
+            (queue.offer, (7,)),
+            (queue.offer, (8,)),
+            (queue.poll_many, (2,), [6, 7]),
+            (print, (queue,)),
+        )
+    )
+
+    def iterate_modifying(queue: Queue[int]) -> list[int]:
+        values = []
+        for value in queue:
+            values.append(value)
+            if value == 0:
+                queue.poll()
+                queue.poll()
+                queue.offer(99)
+        return values
+
+    queue = Queue[int]()
+    for i in range(5):
+        queue.offer(i)
+    verify(((iterate_modifying, (queue,), [0, 1, 2, 3, 4, 99]),))
+
+    deque_queue = DequeQueue[int]()
+    verify(
+        (
+            (deque_queue.offer, (0,)),
+            (deque_queue.offer, (1,)),
+            (deque_queue.offer, (2,)),
+            (print, (deque_queue,)),
+            (deque_queue.poll, (), 0),
+            (deque_queue.peek, (), 1),
+            (deque_queue.poll_many, (2,), [1, 2]),
+            (print, (deque_queue,)),
+        )
+    )
+
+    array_queue = Queue[float].of(float)
+    verify(
+        (
+            (print, (array_queue,)),
+            (array_queue.offer, (0.0,)),
+            (array_queue.offer, (1.5,)),
+            (array_queue.offer, (2.5,)),
+            (print, (array_queue,)),
+            (array_queue.poll, (), 0.0),
+            (array_queue.peek, (), 1.5),
+            (array_queue.poll_many, (2,), [1.5, 2.5]),
+            (print, (array_queue,)),
         )
     )
 
@@ -132,6 +436,20 @@ def test():
         for i in range(count):
             queue.poll()
 
+    def test_deque_queue(count: int):
+        queue = DequeQueue[int]()
+        for i in range(count):
+            queue.offer(i)
+        for i in range(count):
+            queue.poll()
+
+    def test_array_queue(count: int):
+        queue = Queue[int].of(int)
+        for i in range(count):
+            queue.offer(i)
+        for i in range(count):
+            queue.poll()
+
     def test_native_list(count: int):
         lst = list[int]()
         for i in range(count):
@@ -149,6 +467,8 @@ def test():
     benchmark(
         (
             ("       queue", test_queue),
+            (" deque queue", test_deque_queue),
+            (" array queue", test_array_queue),
             (" native list", test_native_list),
             ("native deque", test_native_deque),
         ),
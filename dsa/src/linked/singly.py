@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Generator, Generic, Optional, cast
+
+from .abc import Linked, T
+from .pool import NodePool
+
+
+@dataclasses.dataclass(slots=True)
+class Node(Generic[T]):
+    value: T
+    next: Optional[Node[T]] = None
+
+
+class SinglyLinked(Generic[T], Linked[T]):
+    """
+    Base class for singly linked structures, shared by `Stack` and `Queue`.
+    The chain of nodes starts at `_head` and ends at `_bottom`, which is either `None` or a sentinel node. Nodes are
+    taken from and returned to `_pool` by the subclasses.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: number of elements in the structure
+    """
+
+    __slots__ = ("_pool", "_bottom", "_head", "_length")
+
+    def __init__(self, bottom: Optional[Node[T]]):
+        """
+        > parameters
+        - `bottom`: end of the chain, `None` or a sentinel node
+        """
+        super().__init__()
+        self._pool = NodePool[Node[T]](lambda: Node(cast(T, None)))
+        self._bottom = bottom
+        self._head = bottom
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Generator[T, None, None]:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the structure
+        """
+        pool = self._pool
+        pool.iterators += 1
+        try:
+            bottom = self._bottom
+            cursor = self._head
+            while cursor is not bottom:
+                yield cursor.value  # type: ignore
+                cursor = cursor.next  # type: ignore
+        finally:
+            pool.iterators -= 1
@@ -1,35 +1,122 @@
 from __future__ import annotations
 
-import dataclasses
-from typing import Generator, Generic, Optional
+import array
+import collections
+from typing import Generic, Iterator, cast
 
+from ..packing import ARRAY_TYPECODES
 from .abc import Linked, T
+from .singly import Node, SinglyLinked
 
 
-@dataclasses.dataclass
-class Node(Generic[T]):
-    value: T
-    next: Optional[Node[T]] = None
+class Stack(Generic[T], SinglyLinked[T]):
+    """
+    Linked stack implementation.
+    The bottom of the stack is a sentinel node, so the head is never `None`, empty checks only test the stack length.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: number of elements in the structure
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(Node(cast(T, None)))
+
+    @classmethod
+    def of(cls, value_type: type) -> Stack[T] | ArrayStack[T]:
+        """
+        Create an empty stack specialized for `value_type`.
+        If `value_type` has an `array.array` typecode (`int` or `float`), an `ArrayStack` is returned, otherwise a
+        `Stack`.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value_type`: type of the values to be stored
+        - `return`: new stack
+        """
+        typecode = ARRAY_TYPECODES.get(value_type)
+        return ArrayStack[T](typecode) if typecode is not None else cls()
+
+    def push(self, value: T):
+        """
+        Insert `value` at the top of the stack.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        > parameters
+        - `value`: value to insert
+        """
+        node = self._pool.pop() if self._pool else self._pool.allocate()
+        node.value = value
+        node.next = self._head
+        self._head = node
+        self._length += 1
+
+    def pop(self):
+        """
+        Delete the value at the top of the stack.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: deleted value
+        """
+        if self._length == 0:
+            raise IndexError("empty stack")
+        node = self._head
+        value = node.value
+        self._head = cast(Node[T], node.next)
+        if not self._pool.iterators:
+            node.value = cast(T, None)
+            node.next = None
+            self._pool.append(node)
+        self._length -= 1
+        return value
+
+    def peek(self):
+        """
+        Get the value at the top of the stack without removing it.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value at the top of the stack
+        """
+        if self._length == 0:
+            raise IndexError("empty stack")
+        return self._head.value
 
 
-class Stack(Generic[T], Linked[T]):
+class DequeStack(Generic[T], Linked[T]):
     """
-    Linked stack implementation.
+    Stack implementation backed by `collections.deque`.
+    Same interface as `Stack`, but push and pop are single calls into the C deque, which stores values in fixed size
+    blocks instead of allocating one node per value.
 
     > complexity
     - space: `O(n)`
     - `n`: number of elements in the structure
     """
 
+    __slots__ = ("_deque",)
+
     def __init__(self):
         super().__init__()
-        self._head: Optional[Node[T]] = None
-        self._length = 0
+        self._deque = collections.deque[T]()
 
     def __len__(self) -> int:
-        return self._length
+        return len(self._deque)
 
-    def __iter__(self) -> Generator[T, None, None]:
+    def __iter__(self) -> Iterator[T]:
         """
         Check base class.
 
@@ -38,10 +125,7 @@ class Stack(Generic[T], Linked[T]):
         - space: `O(1)`
         - `n`: length of the stack
         """
-        cursor = self._head
-        while cursor is not None:
-            yield cursor.value
-            cursor = cursor.next
+        return reversed(self._deque)
 
     def push(self, value: T):
         """
@@ -54,8 +138,7 @@ class Stack(Generic[T], Linked[T]):
         > parameters
         - `value`: value to insert
         """
-        self._head = Node(value, self._head)
-        self._length += 1
+        self._deque.append(value)
 
     def pop(self):
         """
@@ -67,12 +150,10 @@ class Stack(Generic[T], Linked[T]):
 
         - `return`: deleted value
         """
-        if self._head is None:
-            raise IndexError("empty stack")
-        value = self._head.value
-        self._head = self._head.next
-        self._length -= 1
-        return value
+        try:
+            return self._deque.pop()
+        except IndexError:
+            raise IndexError("empty stack") from None
 
     def peek(self):
         """
@@ -84,15 +165,91 @@ class Stack(Generic[T], Linked[T]):
 
         - `return`: value at the top of the stack
         """
-        if self._head is None:
+        try:
+            return self._deque[-1]
+        except IndexError:
+            raise IndexError("empty stack") from None
 
-            raise IndexError("empty stack")
-        return self._head.value
 
+class ArrayStack(Generic[T], Linked[T]):
+    """
+    Stack implementation backed by a typed `array.array`.
+    Values are stored unboxed, so every value must fit the array typecode, `int` values are limited to 64 bits.
 
-def test():
-    import collections
+    > complexity
+    - space: `O(n)`
+    - `n`: number of elements in the structure
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(self, typecode: str):
+        """
+        > parameters
+        - `typecode`: `array.array` typecode of the values
+        """
+        super().__init__()
+        self._array = array.array(typecode)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(1)`
+        - `n`: length of the stack
+        """
+        return reversed(self._array)  # type: ignore
+
+    def push(self, value: T):
+        """
+        Insert `value` at the top of the stack.
+
+        > complexity
+        - time: `O(1)` amortized
+        - space: `O(1)` amortized
+
+        > parameters
+        - `value`: value to insert
+        """
+        self._array.append(value)  # type: ignore
+
+    def pop(self):
+        """
+        Delete the value at the top of the stack.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
 
+        - `return`: deleted value
+        """
+        try:
+            return self._array.pop()
+        except IndexError:
+            raise IndexError("empty stack") from None
+
+    def peek(self):
+        """
+        Get the value at the top of the stack without removing it.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+
+        - `return`: value at the top of the stack
+        """
+        try:
+            return self._array[-1]
+        except IndexError:
+            raise IndexError("empty stack") from None
+
+
+def test():
     from ..test import benchmark, verify
 
     stack = Stack[int]()
@@ -119,6 +276,37 @@ def test():
         )
     )
 
+    deque_stack = DequeStack[int]()
+    verify(
+        (
+            (deque_stack.push, (0,)),
+            (deque_stack.push, (1,)),
+            (deque_stack.push, (2,)),
+            (print, (deque_stack,)),
+            (deque_stack.pop, (), 2),
+            (deque_stack.peek, (), 1),
+            (deque_stack.pop, (), 1),
+            (deque_stack.pop, (), 0),
+            (print, (deque_stack,)),
+        )
+    )
+
+    array_stack = Stack[int].of(int)
+    verify(
+        (
+            (print, (array_stack,)),
+            (array_stack.push, (0,)),
+            (array_stack.push, (1,)),
+            (array_stack.push, (2,)),
+            (print, (array_stack,)),
+            (array_stack.pop, (), 2),
+            (array_stack.peek, (), 1),
+            (array_stack.pop, (), 1),
+            (array_stack.pop, (), 0),
+            (print, (array_stack,)),
+        )
+    )
+
     def test_stack(count: int):
         stack = Stack[int]()
         for i in range(count):
@@ -126,6 +314,20 @@ def test():
         for i in range(count):
             stack.pop()
 
+    def test_deque_stack(count: int):
+        stack = DequeStack[int]()
+        for i in range(count):
+            stack.push(i)
+        for i in range(count):
+            stack.pop()
+
+    def test_array_stack(count: int):
+        stack = Stack[int].of(int)
+        for i in range(count):
+            stack.push(i)
+        for i in range(count):
+            stack.pop()
+
     def test_native_list(count: int):
         lst = list[int]()
         for i in range(count):
@@ -143,6 +345,8 @@ def test():
     benchmark(
         (
             ("       stack", test_stack),
+            (" deque stack", test_deque_stack),
+            (" array stack", test_array_stack),
             (" native list", test_native_list),
             ("native deque", test_native_deque),
         ),
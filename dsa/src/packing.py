@@ -0,0 +1,38 @@
+import array
+import itertools
+from typing import MutableSequence, TypeVar
+
+T = TypeVar("T")
+
+# typecodes of the `array.array` specializations for fixed value types
+ARRAY_TYPECODES: dict[type, str] = {int: "q", float: "d"}
+
+
+def pack(data: list[T], start: int = 0) -> MutableSequence[T]:
+    """
+    Pack `data` into an `array.array` if all its values from `start` are `int` (`'q'`) or all are `float` (`'d'`).
+    Values before `start` are not checked, they are converted by the array (unused slots, for example).
+    Arrays store raw machine values contiguously instead of pointers to boxed objects, which reduces memory usage and
+    improves cache usage.
+    If `data` has no values from `start`, is heterogeneous, or contains integers that do not fit in 64 bits, `data`
+    itself is returned.
+
+    > complexity
+    - time: `O(n)`
+    - space: `O(n)`
+    - `n`: length of `data`
+
+    > parameters
+    - `data`: values to pack
+    - `start`: index of the first value checked
+    - `return`: packed array or `data`
+    """
+    if len(data) <= start:
+        return data
+    for value_type, typecode in ARRAY_TYPECODES.items():
+        if all(type(value) is value_type for value in itertools.islice(data, start, None)):
+            try:
+                return array.array(typecode, data)  # type: ignore
+            except OverflowError:
+                return data
+    return data
@@ -9,6 +9,8 @@ class Priority(Generic[T], abc.ABC):
     Abstract base class for priority queues.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return f"{type(self).__name__} {str([*self])}"
 
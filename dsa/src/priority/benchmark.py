@@ -11,7 +11,7 @@ def test():
     from ..tree.rbt import RBT
     from ..tree.veb import VEB
     from .abc import Priority
-    from .heap import Heap
+    from .heap import Heap, NativeHeap
     from .kheap import KHeap
 
     def test_priority(data: list[int], priority: Priority[int]):
@@ -36,6 +36,8 @@ def test():
         (
             ("                      heap", lambda data: test_priority(data, Heap[int](lambda a, b: a - b))),
             ("            heap (heapify)", lambda d: test_heap(d, lambda d: Heap[int](lambda a, b: a - b, d))),
+            ("                heapq heap", lambda data: test_priority(data, NativeHeap[int]())),
+            ("      heapq heap (heapify)", lambda d: test_heap(d, lambda d: NativeHeap[int](d))),
             ("          k-ary heap (k=2)", lambda data: test_priority(data, KHeap[int](lambda a, b: a - b, k=2))),
             (" k-ary heap (k=2, heapify)", lambda d: test_heap(d, lambda d: KHeap[int](lambda a, b: a - b, d, 2))),
             ("          k-ary heap (k=4)", lambda data: test_priority(data, KHeap[int](lambda a, b: a - b, k=4))),
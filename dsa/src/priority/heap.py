@@ -1,3 +1,4 @@
+import heapq
 from typing import Callable, Generator, Generic, Literal, Optional
 
 from .abc import Priority, T
@@ -9,6 +10,7 @@ def sift_up(heap: list[T], i: int, comparator: Callable[[T, T], float]):
     The `comparator` function is used to compare for a min heap.
     For a max heap, `comparator` output or logic can be negated.
     Sift up moves the element at `i` up in the heap according to `comparator`.
+    The element is kept aside while its ancestors are moved down, and is written only once at its final position.
 
     > complexity
     - time: `O(log(n))`
@@ -20,9 +22,14 @@ def sift_up(heap: list[T], i: int, comparator: Callable[[T, T], float]):
     - `i`: index of value to sift up
     - `comparator`: a min comparator to check values (smaller values go to the top)
     """
-    while (parent := (i - 1) // 2) >= 0 and comparator(heap[i], heap[parent]) < 0:
-        heap[i], heap[parent] = heap[parent], heap[i]
+    item = heap[i]
+    while i > 0:
+        parent = (i - 1) // 2
+        if comparator(item, heap[parent]) >= 0:
+            break
+        heap[i] = heap[parent]
         i = parent
+    heap[i] = item
 
 
 def sift_down(heap: list[T], i: int, comparator: Callable[[T, T], float], length: Optional[int] = None):
@@ -31,6 +38,7 @@ def sift_down(heap: list[T], i: int, comparator: Callable[[T, T], float], length
     The `comparator` function is used to compare for a min heap.
     For a max heap, `comparator` output or logic can be negated.
     Sift down moves the element at `i` down in the heap, up to `length - 1` index, according to `comparator`.
+    The element is kept aside while the smallest children are moved up, and is written only once at its final position.
 
     > complexity
     - time: `O(log(n))`
@@ -44,17 +52,16 @@ def sift_down(heap: list[T], i: int, comparator: Callable[[T, T], float], length
     - `length`: limit the length of the heap
     """
     length = length if length is not None else len(heap)
-    while (left := i * 2 + 1) and left < length:
-        right = left + 1
-        chosen = i
-        if comparator(heap[chosen], heap[left]) > 0:
-            chosen = left
-        if right < length and comparator(heap[chosen], heap[right]) > 0:
-            chosen = right
-        if chosen == i:
+    item = heap[i]
+    while (child := i * 2 + 1) < length:
+        right = child + 1
+        if right < length and comparator(heap[right], heap[child]) < 0:
+            child = right
+        if comparator(item, heap[child]) <= 0:
             break
-        heap[i], heap[chosen] = heap[chosen], heap[i]
-        i = chosen
+        heap[i] = heap[child]
+        i = child
+    heap[i] = item
 
 
 def heapify_top_down(heap: list[T], comparator: Callable[[T, T], float], length: Optional[int] = None):
@@ -109,6 +116,8 @@ class Heap(Generic[T], Priority[T]):
     - `n`: number of elements in the structure.
     """
 
+    __slots__ = ("_comparator", "_heap")
+
     def __init__(
         self,
         comparator: Callable[[T, T], float],
@@ -147,13 +156,14 @@ class Heap(Generic[T], Priority[T]):
         - `n`: length of the heap
         """
         heap = self._heap.copy()
-        for _ in range(len(heap)):
+        comparator = self._comparator
+        for length in range(len(heap) - 1, -1, -1):
             yield heap[0]
             replacement = heap.pop()
-            if len(heap) == 0:
+            if length == 0:
                 break
             heap[0] = replacement
-            sift_down(heap, 0, self._comparator)
+            sift_down(heap, 0, comparator, length)
 
     def offer(self, value: T):
         """
@@ -164,8 +174,9 @@ class Heap(Generic[T], Priority[T]):
         - space: `O(1)`
         - `n`: length of the heap
         """
-        self._heap.append(value)
-        sift_up(self._heap, len(self._heap) - 1, self._comparator)
+        heap = self._heap
+        heap.append(value)
+        sift_up(heap, len(heap) - 1, self._comparator)
 
     def poll(self) -> T:
         """
@@ -176,15 +187,40 @@ class Heap(Generic[T], Priority[T]):
         - space: `O(1)`
         - `n`: length of the heap
         """
-        if len(self._heap) == 0:
-            raise IndexError("empty heap")
-        value = self._heap[0]
-        replacement = self._heap.pop()
-        if len(self._heap) > 0:
-            self._heap[0] = replacement
-            sift_down(self._heap, 0, self._comparator)
+        heap = self._heap
+        try:
+            replacement = heap.pop()
+        except IndexError:
+            raise IndexError("empty heap") from None
+        if len(heap) == 0:
+            return replacement
+        value = heap[0]
+        heap[0] = replacement
+        sift_down(heap, 0, self._comparator)
         return value
 
+    def poll_offer(self, value: T) -> T:
+        """
+        Delete and return the next value from the heap, then insert `value`.
+        Equivalent to `poll` followed by `offer`, but `value` replaces the top and is sifted down once.
+
+        > complexity
+        - time: `O(log(n))`
+        - space: `O(1)`
+        - `n`: length of the heap
+
+        > parameters
+        - `value`: value to insert
+        - `return`: deleted value
+        """
+        heap = self._heap
+        if len(heap) == 0:
+            raise IndexError("empty heap")
+        top = heap[0]
+        heap[0] = value
+        sift_down(heap, 0, self._comparator)
+        return top
+
     def peek(self) -> T:
         """
         Check abstract class for documentation.
@@ -198,6 +234,116 @@ class Heap(Generic[T], Priority[T]):
         return self._heap[0]
 
 
+class NativeHeap(Generic[T], Priority[T]):
+    """
+    Binary Heap implementation backed by the `heapq` module.
+    Same interface as `Heap`, but values are ordered by their natural order instead of a comparator, so sifting runs
+    entirely in C without calling back into Python. Max heaps are supported for numeric values, which are stored
+    negated.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: number of elements in the structure.
+    """
+
+    __slots__ = ("_heap", "_sign")
+
+    def __init__(self, data: Optional[list[T]] = None, reverse: bool = False):
+        """
+        Initialize the binary heap, `data` is heapified in place.
+        If `reverse` is set, `data` is not modified, its negated values are heapified in a new list.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(n)`
+        - `n`: length of `data`
+
+        > parameters
+        - `data`: initial data to populate the heap
+        - `reverse`: build a max heap, values must be numeric
+        """
+        super().__init__()
+        self._sign = -1 if reverse else 1
+        self._heap: list[T] = data if data is not None else []
+        if reverse:
+            self._heap = [-v for v in self._heap]  # type: ignore
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Generator[T, None, None]:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(n*log(n))`
+        - space: `O(n)`
+        - `n`: length of the heap
+        """
+        if self._sign == 1:
+            yield from sorted(self._heap)
+        else:
+            yield from (-v for v in sorted(self._heap))  # type: ignore
+
+    def offer(self, value: T):
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(log(n))`
+        - space: `O(1)`
+        - `n`: length of the heap
+        """
+        heapq.heappush(self._heap, value if self._sign == 1 else -value)  # type: ignore
+
+    def poll(self) -> T:
+        """
+        Check base class.
+
+        > complexity
+        - time: `O(log(n))`
+        - space: `O(1)`
+        - `n`: length of the heap
+        """
+        try:
+            value = heapq.heappop(self._heap)
+        except IndexError:
+            raise IndexError("empty heap") from None
+        return value if self._sign == 1 else -value  # type: ignore
+
+    def poll_offer(self, value: T) -> T:
+        """
+        Delete and return the next value from the heap, then insert `value`, see `heapq.heapreplace`.
+
+        > complexity
+        - time: `O(log(n))`
+        - space: `O(1)`
+        - `n`: length of the heap
+
+        > parameters
+        - `value`: value to insert
+        - `return`: deleted value
+        """
+        try:
+            top = heapq.heapreplace(self._heap, value if self._sign == 1 else -value)  # type: ignore
+        except IndexError:
+            raise IndexError("empty heap") from None
+        return top if self._sign == 1 else -top  # type: ignore
+
+    def peek(self) -> T:
+        """
+        Check abstract class for documentation.
+
+        > complexity
+        - time: `O(1)`
+        - space: `O(1)`
+        """
+        if len(self._heap) == 0:
+            raise IndexError("empty heap")
+        return self._heap[0] if self._sign == 1 else -self._heap[0]  # type: ignore
+
+
 def test():
     import random
 
@@ -226,6 +372,26 @@ def test():
             (heap.poll, (), 7),
             (heap.poll, (), 8),
             (print, (heap,)),
+            (heap.poll_offer, (0,), 9),
+            (heap.poll_offer, (16,), 0),
+            (heap.poll, (), 10),
+            (print, (heap,)),
+        )
+    )
+
+    native_heap = NativeHeap[int](random.sample([i for i in range(10)], 10), reverse=True)
+    verify(
+        (
+            (print, (native_heap,)),
+            (native_heap.offer, (10,)),
+            (native_heap.offer, (-1,)),
+            (native_heap.peek, (), 10),
+            (native_heap.poll, (), 10),
+            (native_heap.poll, (), 9),
+            (print, (native_heap,)),
+            (native_heap.poll, (), 8),
+            (native_heap.poll_offer, (-2,), 7),
+            (len, (native_heap,), 9),
         )
     )
 
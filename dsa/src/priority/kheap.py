@@ -1,14 +1,17 @@
-from typing import Callable, Generator, Generic, Literal, Optional
+import array
+from typing import Callable, Generator, Generic, Literal, MutableSequence, Optional, cast
 
+from ..packing import ARRAY_TYPECODES, pack
 from .abc import Priority, T
 
 
-def sift_up(heap: list[T], k: int, i: int, comparator: Callable[[T, T], float]):
+def sift_up(heap: MutableSequence[T], k: int, i: int, comparator: Callable[[T, T], float]):
     """
     K-Heap sift up algorithm.
     The `comparator` function is used to compare for a min heap.
     For a max heap, `comparator` output or logic can be negated.
     Sift up moves the element at `i` up in the heap according to `comparator`.
+    The element is kept aside while its ancestors are moved down, and is written only once at its final position.
 
     > complexity
     - time: `O(k*log(n, k))`
@@ -22,12 +25,19 @@ def sift_up(heap: list[T], k: int, i: int, comparator: Callable[[T, T], float]):
     - `i`: index of value to sift up
     - `comparator`: a min comparator to check values (smaller values go to the top)
     """
-    while (parent := (i - 1) // k) >= 0 and comparator(heap[i], heap[parent]) < 0:
-        heap[i], heap[parent] = heap[parent], heap[i]
+    item = heap[i]
+    while i > 0:
+        parent = (i - 1) // k
+        if comparator(item, heap[parent]) >= 0:
+            break
+        heap[i] = heap[parent]
         i = parent
+    heap[i] = item
 
 
-def sift_down(heap: list[T], k: int, i: int, comparator: Callable[[T, T], float], length: Optional[int] = None):
+def sift_down(
+    heap: MutableSequence[T], k: int, i: int, comparator: Callable[[T, T], float], length: Optional[int] = None
+):
     """
     K-Heap sift down algorithm.
     The `comparator` function is used to compare for a min heap.
@@ -66,7 +76,9 @@ def sift_down(heap: list[T], k: int, i: int, comparator: Callable[[T, T], float]
         i = chosen
 
 
-def heapify_top_down(heap: list[T], k: int, comparator: Callable[[T, T], float], length: Optional[int] = None):
+def heapify_top_down(
+    heap: MutableSequence[T], k: int, comparator: Callable[[T, T], float], length: Optional[int] = None
+):
     """
     Heapify the `heap` list using top down strategy.
     The `comparator` function is used to compare for a min heap.
@@ -89,7 +101,9 @@ def heapify_top_down(heap: list[T], k: int, comparator: Callable[[T, T], float],
         sift_up(heap, k, i, comparator)
 
 
-def heapify_bottom_up(heap: list[T], k: int, comparator: Callable[[T, T], float], length: Optional[int] = None):
+def heapify_bottom_up(
+    heap: MutableSequence[T], k: int, comparator: Callable[[T, T], float], length: Optional[int] = None
+):
     """
     Heapify the `heap` list using bottom up strategy.
     This strategy is faster then top down.
@@ -116,18 +130,26 @@ def heapify_bottom_up(heap: list[T], k: int, comparator: Callable[[T, T], float]
 class KHeap(Generic[T], Priority[T]):
     """
     K-Heap implementation.
+    If `packed` is set and the initial `data` contains only `int` or only `float` values, the heap is stored in an
+    `array.array` (see `pack`), and falls back to a `list` when a value of another type is offered.
+    Packing trades time for memory: the array stores raw machine values instead of pointers to boxed objects, but every
+    read in `sift_up` and `sift_down` creates a new object, which makes heap operations about 20% slower.
 
     > complexity
     - space: `O(n)`
     - `n`: number of elements in the structure.
     """
 
+    __slots__ = ("_comparator", "_heap", "_k")
+
     def __init__(
         self,
         comparator: Callable[[T, T], float],
         data: Optional[list[T]] = None,
         k: int = 4,
         strategy: Literal["bottom-up", "top-down"] = "bottom-up",
+        copy: bool = True,
+        packed: bool = False,
     ):
         """
         Initialize the binary heap
@@ -142,10 +164,22 @@ class KHeap(Generic[T], Priority[T]):
         - `comparator`: a comparator function for heap values
         - `data`: initial data to populate the heap
         - `strategy`: initial heapify strategy, only impacts initial `data`
+        - `copy`: copy `data` into the heap, if `False`, `data` is used as the heap storage and is modified in place
+            (it is also never packed)
+        - `packed`: store copied `int` or `float` data in an `array.array`, using less memory but slower
         """
         super().__init__()
         self._comparator = comparator
-        self._heap: list[T] = data if data is not None else []
+        self._heap: MutableSequence[T]
+        if data is None:
+            self._heap = []
+        elif not copy:
+            self._heap = data
+        elif packed:
+            packed_data = pack(data)
+            self._heap = packed_data if packed_data is not data else list(data)
+        else:
+            self._heap = list(data)
         self._k = k
         heapify_function = heapify_bottom_up if strategy == "bottom-up" else heapify_top_down
         heapify_function(self._heap, self._k, self._comparator)
@@ -166,14 +200,15 @@ class KHeap(Generic[T], Priority[T]):
         - `n`: length of the heap
         - `k`: arity of the heap
         """
-        heap = self._heap.copy()
-        for _ in range(len(heap)):
+        heap = self._heap[:]
+        k, comparator = self._k, self._comparator
+        for length in range(len(heap) - 1, -1, -1):
             yield heap[0]
             replacement = heap.pop()
-            if len(heap) == 0:
+            if length == 0:
                 break
             heap[0] = replacement
-            sift_down(heap, self._k, 0, self._comparator)
+            sift_down(heap, k, 0, comparator, length)
 
     def offer(self, value: T):
         """
@@ -185,7 +220,13 @@ class KHeap(Generic[T], Priority[T]):
         - `n`: length of the heap
         - `k`: arity of the heap
         """
-        self._heap.append(value)
+        if isinstance(self._heap, array.array) and ARRAY_TYPECODES.get(type(value)) != self._heap.typecode:
+            self._heap = self._heap.tolist()
+        try:
+            self._heap.append(value)
+        except OverflowError:
+            self._heap = cast(array.array, self._heap).tolist()
+            self._heap.append(value)
         sift_up(self._heap, self._k, len(self._heap) - 1, self._comparator)
 
     def poll(self) -> T:
@@ -198,14 +239,45 @@ class KHeap(Generic[T], Priority[T]):
         - `n`: length of the heap
         - `k`: arity of the heap
         """
+        heap = self._heap
+        try:
+            replacement = heap.pop()
+        except IndexError:
+            raise IndexError("empty heap") from None
+        if len(heap) == 0:
+            return replacement
+        value = heap[0]
+        heap[0] = replacement
+        sift_down(heap, self._k, 0, self._comparator)
+        return value
+
+    def poll_offer(self, value: T) -> T:
+        """
+        Delete and return the next value from the heap, then insert `value`.
+        Equivalent to `poll` followed by `offer`, but `value` replaces the top and is sifted down once.
+
+        > complexity
+        - time: `O(k*log(n, k))`
+        - space: `O(1)`
+        - `n`: length of the heap
+        - `k`: arity of the heap
+
+        > parameters
+        - `value`: value to insert
+        - `return`: deleted value
+        """
         if len(self._heap) == 0:
             raise IndexError("empty heap")
-        value = self._heap[0]
-        replacement = self._heap.pop()
-        if len(self._heap) > 0:
-            self._heap[0] = replacement
-            sift_down(self._heap, self._k, 0, self._comparator)
-        return value
+        if isinstance(self._heap, array.array) and ARRAY_TYPECODES.get(type(value)) != self._heap.typecode:
+            self._heap = self._heap.tolist()
+        top = self._heap[0]
+        try:
+            self._heap[0] = value
+        except OverflowError:
+            self._heap = cast(array.array, self._heap).tolist()
+            self._heap[0] = value
+        sift_down(self._heap, self._k, 0, self._comparator)
+        return top
 
     def peek(self) -> T:
         """
@@ -248,6 +320,10 @@ def test():
             (heap.poll, (), 7),
             (heap.poll, (), 8),
             (print, (heap,)),
+            (heap.poll_offer, (0,), 9),
+            (heap.poll_offer, (16,), 0),
+            (heap.poll, (), 10),
+            (print, (heap,)),
         )
     )
 
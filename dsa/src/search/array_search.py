@@ -1,17 +1,19 @@
-import math
-from typing import Callable, Optional
+import bisect
+from typing import Callable, Iterable, Optional
 
 
 def binary_search(
     array: list[float],
     key: float,
-    comparator: Callable[[float, float], float] = lambda a, b: a - b,
+    comparator: Optional[Callable[[float, float], float]] = None,
     left: Optional[int] = None,
     right: Optional[int] = None,
 ) -> int:
     """
     Binary search algorithm.
     Require `array` to be sorted based on `comparator`.
+    If `comparator` is `None`, values are compared with the `<` operator by `bisect.bisect_left`, which runs the whole
+    search in C, and the leftmost occurrence of `key` is returned.
 
     > complexity
     - time: `O(log(n))`
@@ -21,13 +23,18 @@ def binary_search(
     > parameters
     - `array`: array to search `key`
     - `key`: key to be search in `array`
-    - `comparator`: comparator of values
+    - `comparator`: comparator of values, natural ordering if `None`
     - `left`: starting index to search
     - `right`: ending index to search
     - `return`: index of `key` in `array`
     """
     left = left if left is not None else 0
     right = right if right is not None else len(array) - 1
+    if comparator is None:
+        index = bisect.bisect_left(array, key, left, right + 1)
+        if index <= right and array[index] == key:
+            return index
+        raise KeyError(f"key ({key}) not found")
     while left <= right:
         center = (left + right) // 2
         comparison = comparator(key, array[center])
@@ -40,10 +47,93 @@ def binary_search(
     raise KeyError(f"key ({key}) not found")
 
 
+def binary_search_branchless(
+    array: list[float],
+    key: float,
+    left: Optional[int] = None,
+    right: Optional[int] = None,
+) -> int:
+    """
+    Branchless binary search algorithm.
+    Require `array` to be sorted in natural order.
+    The search range is halved a fixed number of times, each step does a single `<` comparison that only selects the
+    next base index (a conditional move in compiled code), and equality is checked once at the end. The running time
+    depends only on the length of the range, not on where `key` is found.
+
+    > complexity
+    - time: `O(log(n))`
+    - space: `O(1)`
+    - `n`: length of `array`
+
+    > parameters
+    - `array`: array to search `key`
+    - `key`: key to be search in `array`
+    - `left`: starting index to search
+    - `right`: ending index to search
+    - `return`: index of `key` in `array`
+    """
+    left = left if left is not None else 0
+    right = right if right is not None else len(array) - 1
+    if left > right:
+        raise KeyError(f"key ({key}) not found")
+    base = left
+    length = right - left + 1
+    while length > 1:
+        half = length >> 1
+        base = base + half if array[base + half] < key else base
+        length -= half
+    base += array[base] < key
+    if base <= right and array[base] == key:
+        return base
+    raise KeyError(f"key ({key}) not found")
+
+
+def binary_search_batch(array: list[float], keys: Iterable[float], sorted_keys: bool = False) -> list[int]:
+    """
+    Binary search algorithm for a batch of keys.
+    Require `array` to be sorted in natural order.
+    The index found for the previous key is used as a guess for the next one, the guess and its two neighbours on each
+    side are checked before falling back to `binary_search`. If `keys` are sorted, only the forward neighbours are
+    checked and the fallback only searches after the guess.
+
+    > complexity
+    - time: `O(m*log(n))`, `O(m)` if consecutive keys are at most two positions apart
+    - space: `O(m)`
+    - `n`: length of `array`
+    - `m`: number of keys
+
+    > parameters
+    - `array`: array to search `keys`
+    - `keys`: keys to be search in `array`
+    - `sorted_keys`: if `keys` are sorted in natural order
+    - `return`: list of indices of `keys` in `array`
+    """
+    indices = []
+    length = len(array)
+    guess = 0
+    for key in keys:
+        if guess < length and array[guess] == key:
+            pass
+        elif guess + 1 < length and array[guess + 1] == key:
+            guess += 1
+        elif guess + 2 < length and array[guess + 2] == key:
+            guess += 2
+        elif sorted_keys:
+            guess = binary_search(array, key, None, guess + 3)
+        elif guess > 0 and array[guess - 1] == key:
+            guess -= 1
+        elif guess > 1 and array[guess - 2] == key:
+            guess -= 2
+        else:
+            guess = binary_search(array, key)
+        indices.append(guess)
+    return indices
+
+
 def k_ary_search(
     array: list[float],
     key: float,
-    comparator: Callable[[float, float], float] = lambda a, b: a - b,
+    comparator: Optional[Callable[[float, float], float]] = None,
     left: Optional[int] = None,
     right: Optional[int] = None,
     k: int = 4,
@@ -51,6 +141,8 @@ def k_ary_search(
     """
     K-ary search algorithm.
     Require `array` to be sorted based on `comparator`.
+    If `comparator` is `None`, values are compared with the `<` operator in a specialized loop that avoids calling a
+    comparator function for every probe, the loop is unrolled for the default `k == 4`.
 
     > complexity
     - time: `O(k*log(n,k))`
@@ -61,7 +153,7 @@ def k_ary_search(
     > parameters
     - `array`: array to search `key`
     - `key`: key to be search in `array`
-    - `comparator`: comparator of values
+    - `comparator`: comparator of values, natural ordering if `None`
     - `left`: starting index to search
     - `right`: ending index to search
     - `k`: number of buckets to subdivide search
@@ -70,11 +162,48 @@ def k_ary_search(
     left = left if left is not None else 0
     right = right if right is not None else len(array) - 1
     k = max(k, 2)
+    if comparator is None and k == 4:
+        # unrolled quaternary step, the middle pivot is checked first, so a level costs two probes instead of three
+        while left <= right:
+            width = right - left
+            middle = left + (width >> 1)
+            value = array[middle]
+            if key < value:
+                center = left + (width >> 2)
+                right = middle - 1
+            elif value < key:
+                center = left + (width * 3 >> 2)
+                left = middle + 1
+            else:
+                return middle
+            value = array[center]
+            if key < value:
+                right = center - 1
+            elif value < key:
+                left = center + 1
+            else:
+                return center
+        raise KeyError(f"key ({key}) not found")
+    if comparator is None:
+        while left <= right:
+            width = right - left
+            base_left = left
+            for i in range(1, k):
+                center = base_left + width * i // k
+                value = array[center]
+                if key < value:
+                    right = center - 1
+                    break
+                elif value < key:
+                    left = center + 1
+                else:
+                    return center
+        raise KeyError(f"key ({key}) not found")
     while left <= right:
-        step = (right - left) / k
+        width = right - left
         base_left = left
         for i in range(1, k):
-            center = base_left + math.floor(step * i)
+            center = base_left + width * i // k
             comparison = comparator(key, array[center])
             if comparison < 0:
                 right = center - 1
@@ -86,10 +215,14 @@ def k_ary_search(
     raise KeyError(f"key ({key}) not found")
 
 
+INTERPOLATION_PROBES = 16
+INTERPOLATION_SCAN = 16
+
+
 def interpolation_search(
     array: list[int],
     key: int,
-    comparator: Callable[[int, int], int] = lambda a, b: a - b,
+    comparator: Optional[Callable[[int, int], int]] = None,
     left: Optional[int] = None,
     right: Optional[int] = None,
 ) -> int:
@@ -97,16 +230,21 @@ def interpolation_search(
     Interpolation search algorithm.
     Require `array` to be sorted based on `comparator`.
     Faster than binary search for uniformly distributed arrays.
+    If `comparator` is `None`, probes are compared with the branchless three-way expression `(a > b) - (a < b)`
+    instead of calling a comparator function.
+    Windows smaller than `INTERPOLATION_SCAN` are scanned linearly, and if the key is not found after
+    `INTERPOLATION_PROBES` interpolations, the remaining window is searched with `binary_search`, which bounds the
+    worst case of skewed arrays.
 
     > complexity
-    - time: `O(log(log(n))) uniformly distributed arrays, worst: O(n)`
+    - time: `O(log(log(n))) uniformly distributed arrays, worst: O(log(n))`
     - space: `O(1)`
     - `n`: length of `array`
 
     > parameters
     - `array`: array to search `key`
     - `key`: key to be search in `array`
-    - `comparator`: comparator for `<T>` type values
+    - `comparator`: comparator of values, natural ordering if `None`
     - `left`: starting index to search
     - `right`: ending index to search
 
@@ -114,16 +252,31 @@ def interpolation_search(
     """
     left = left if left is not None else 0
     right = right if right is not None else len(array) - 1
-    while array[left] != array[right] and array[left] <= key <= array[right]:
-        center = left + ((key - array[left]) * (right - left)) // (array[right] - array[left])
-        comparison = comparator(key, array[center])
+    for _ in range(INTERPOLATION_PROBES):
+        if right - left < INTERPOLATION_SCAN:
+            for i in range(left, right + 1):
+                value = array[i]
+                comparison = (key > value) - (key < value) if comparator is None else comparator(key, value)
+                if comparison <= 0:
+                    if comparison == 0:
+                        return i
+                    break
+            raise KeyError(f"key ({key}) not found")
+        low, high = array[left], array[right]
+        if low == high or not low <= key <= high:
+            break
+        center = left + ((key - low) * (right - left)) // (high - low)
+        value = array[center]
+        comparison = (key > value) - (key < value) if comparator is None else comparator(key, value)
         if comparison < 0:
             right = center - 1
         elif comparison > 0:
             left = center + 1
         else:
             return center
-    if comparator(key, array[left]) == 0:
+    else:
+        return binary_search(array, key, comparator, left, right)
+    if array[left] == key if comparator is None else comparator(key, array[left]) == 0:
         return left
     raise KeyError(f"key ({key}) not found")
 
@@ -131,23 +284,27 @@ def interpolation_search(
 def exponential_search(
     array: list[float],
     key: float,
-    comparator: Callable[[float, float], float] = lambda a, b: a - b,
+    comparator: Optional[Callable[[float, float], float]] = None,
     left: Optional[int] = None,
     right: Optional[int] = None,
 ) -> int:
     """
     Exponential search algorithm.
     Require `array` to be sorted based on `comparator`.
+    If `comparator` is `None`, values are compared with the `<` operator in specialized loops that avoid calling a
+    comparator function for every probe.
+    The bound doubles from `left` until it passes `key`, then the window between the last two bounds is binary searched
+    in the same loop.
 
     > complexity
     - time: `O(log(i))`
     - space: `O(1)`
-    - `i`: index of `key` in `array`
+    - `i`: distance from `left` to the index of `key` in `array`
 
     > parameters
     - `array`: array to search `key`
     - `key`: key to be search in `array`
-    - `comparator`: comparator for `<T>` type values
+    - `comparator`: comparator of values, natural ordering if `None`
     - `left`: starting index to search
     - `right`: ending index to search
 
@@ -156,9 +313,166 @@ def exponential_search(
     left = left if left is not None else 0
     right = right if right is not None else len(array) - 1
     bound = 1
-    while bound * 2 <= left or bound <= right and key > array[bound]:
+    if comparator is None:
+        while left + bound <= right and array[left + bound] < key:
+            bound *= 2
+        right = min(left + bound, right)
+        left += bound // 2
+        while left <= right:
+            center = (left + right) // 2
+            value = array[center]
+            if key < value:
+                right = center - 1
+            elif value < key:
+                left = center + 1
+            else:
+                return center
+        raise KeyError(f"key ({key}) not found")
+    while left + bound <= right and comparator(key, array[left + bound]) > 0:
         bound *= 2
-    return binary_search(array, key, comparator, max(bound // 2, left), min(bound, right))
+    right = min(left + bound, right)
+    left += bound // 2
+    while left <= right:
+        center = (left + right) // 2
+        comparison = comparator(key, array[center])
+        if comparison < 0:
+            right = center - 1
+        elif comparison > 0:
+            left = center + 1
+        else:
+            return center
+    raise KeyError(f"key ({key}) not found")
+
+
+class EytzingerIndex:
+    """
+    Sorted array rearranged in Eytzinger layout (the breadth first order of an implicit binary search tree), built once
+    for workloads doing many searches against the same array.
+    The first levels of the tree are stored next to each other, so the first probes of every search hit the same few
+    cache lines, and the children of a node are contiguous. The search loop has a single comparison per level and no
+    early exit, the position of the answer is recovered at the end from the path bits.
+    Require the array to be sorted in natural order.
+
+    > complexity
+    - space: `O(n)`
+    - `n`: length of the array
+    """
+
+    __slots__ = ("_tree", "_indices")
+
+    def __init__(self, array: list[float]):
+        """
+        Build the Eytzinger layout of `array` with an in-order traversal of the implicit tree.
+
+        > complexity
+        - time: `O(n)`
+        - space: `O(n)`
+        - `n`: length of `array`
+
+        > parameters
+        - `array`: sorted array
+        """
+        n = len(array)
+        self._tree: list[Optional[float]] = [None] * (n + 1)
+        self._indices = [0] * (n + 1)
+        stack = list[int]()
+        i = 0
+        k = 1
+        while len(stack) > 0 or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self._tree[k] = array[i]
+            self._indices[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def search(self, key: float) -> int:
+        """
+        Search `key` in the indexed array.
+
+        > complexity
+        - time: `O(log(n))`
+        - space: `O(1)`
+        - `n`: length of the array
+
+        > parameters
+        - `key`: key to be search
+        - `return`: index of `key` in the original sorted array
+        """
+        tree = self._tree
+        n = len(tree) - 1
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < key)  # type: ignore
+        # drop the trailing right turns and the last left turn, the remaining path leads to the lower bound of `key`
+        k >>= (k ^ (k + 1)).bit_length()
+        if k == 0 or tree[k] != key:
+            raise KeyError(f"key ({key}) not found")
+        return self._indices[k]
+
+
+class MemoizedBinarySearcher:
+    """
+    Binary searcher that remembers the index of the last found key, built for query streams with temporal locality.
+    Each search starts at the last found index and gallops towards `key` doubling the step, like exponential search,
+    then runs `binary_search` on the window found, so keys close to the previous one are found in a few probes.
+    Random query streams pay for the gallop and should use `binary_search` instead.
+    Require the array to be sorted in natural order.
+
+    > complexity
+    - space: `O(1)`, the array is not copied
+    """
+
+    __slots__ = ("_array", "_last")
+
+    def __init__(self, array: list[float]):
+        """
+        > parameters
+        - `array`: sorted array
+        """
+        self._array = array
+        self._last = 0
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def search(self, key: float) -> int:
+        """
+        Search `key` in the array, starting from the index of the last found key.
+
+        > complexity
+        - time: `O(log(d))`
+        - space: `O(1)`
+        - `d`: distance between the index of `key` and the index of the last found key
+
+        > parameters
+        - `key`: key to be search
+        - `return`: index of `key` in the array
+        """
+        array = self._array
+        length = len(array)
+        i = self._last
+        if i >= length:
+            raise KeyError(f"key ({key}) not found")
+        value = array[i]
+        if value == key:
+            return i
+        bound = 1
+        if value < key:
+            while i + bound < length and array[i + bound] < key:
+                bound <<= 1
+            left, right = i + (bound >> 1) + 1, min(i + bound, length - 1)
+        else:
+            while i - bound >= 0 and key < array[i - bound]:
+                bound <<= 1
+            left, right = max(i - bound, 0), i - (bound >> 1) - 1
+        self._last = binary_search(array, key, None, left, right)
+        return self._last
 
 
 def test():
@@ -171,6 +485,17 @@ def test():
             (binary_search, ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 6), 6),
             (binary_search, ([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20], 8), 4),
             (binary_search, ([1, 10, 100, 1000, 10000, 100000, 1000000], 10), 1),
+            (binary_search_branchless, ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 6), 6),
+            (binary_search_branchless, ([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20], 8), 4),
+            (binary_search_branchless, ([1, 10, 100, 1000, 10000, 100000, 1000000], 10), 1),
+            (binary_search_batch, ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [6, 7, 9, 2, 1]), [6, 7, 9, 2, 1]),
+            (binary_search_batch, ([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20], [8, 10, 20], True), [4, 5, 10]),
+            (EytzingerIndex([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]).search, (6,), 6),
+            (EytzingerIndex([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20]).search, (8,), 4),
+            (EytzingerIndex([1, 10, 100, 1000, 10000, 100000, 1000000]).search, (10,), 1),
+            (MemoizedBinarySearcher([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]).search, (6,), 6),
+            (MemoizedBinarySearcher([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20]).search, (8,), 4),
+            (MemoizedBinarySearcher([1, 10, 100, 1000, 10000, 100000, 1000000]).search, (10,), 1),
             (k_ary_search, ([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 6), 6),
             (k_ary_search, ([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20], 8), 4),
             (k_ary_search, ([1, 10, 100, 1000, 10000, 100000, 1000000], 10), 1),
@@ -185,6 +510,7 @@ def test():
     benchmark(
         (
             ("       binary search", lambda array: binary_search(array, random.sample(array, 1)[0])),
+            ("   branchless search", lambda array: binary_search_branchless(array, random.sample(array, 1)[0])),
             ("  k-ary search (k=2)", lambda array: k_ary_search(array, random.sample(array, 1)[0], k=2)),
             ("  k-ary search (k=4)", lambda array: k_ary_search(array, random.sample(array, 1)[0], k=4)),
             ("  k-ary search (k=8)", lambda array: k_ary_search(array, random.sample(array, 1)[0], k=8)),
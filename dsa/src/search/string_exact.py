@@ -1,9 +1,42 @@
 import collections
+import itertools
 
+NATIVE_THRESHOLD = 16
 
-def brute_force(text: bytes, pattern: bytes) -> list[int]:
+
+def native(text: bytes, pattern: bytes) -> list[int]:
+    """
+    Native exact string searching, occurrences are located with the `find` method of `text`, which is implemented in C
+    by CPython (`bytes`, `bytearray` and `mmap.mmap`).
+    The other algorithms delegate to `native` if `pattern` is not longer than `native_threshold`, short patterns are
+    matched by CPython faster than any of them can be run in Python.
+
+    > complexity
+    - time: `O(n * p)`, usually `O(n)`
+    - space: `O(1)`
+    - `n`: length of `text`
+    - `p`: length of `pattern`
+
+    > parameters
+    - `text`: text to search for occurrences of pattern
+    - `pattern`: pattern
+    - `return`: list containing the starting index of all occurrences
+    """
+    if len(pattern) == 0:
+        raise Exception("empty pattern")
+    occurrences: list[int] = []
+    i = text.find(pattern)
+    while i != -1:
+        occurrences.append(i)
+        i = text.find(pattern, i + 1)
+    return occurrences
+
+
+def brute_force(text: bytes, pattern: bytes, native_threshold: int = NATIVE_THRESHOLD) -> list[int]:
     """
     Brute force exact string searching algorithm.
+    Candidate positions are located with `find` on the first byte of `pattern` and verified with a slice comparison,
+    both run in C (`memchr` and `memcmp`), instead of comparing byte by byte in Python.
     Some string searching algorithms do not support empty `pattern`.
     For maching specifications, all algorithms raise exceptions if the `pattern` is empty.
 
@@ -16,21 +49,32 @@ def brute_force(text: bytes, pattern: bytes) -> list[int]:
     > parameters
     - `text`: text to search for occurrences of pattern
     - `pattern`: pattern
+    - `native_threshold`: patterns up to this length are delegated to `native`, `0` always runs the algorithm
     - `return`: list containing the starting index of all occurrences
     """
     if len(pattern) == 0:
         raise Exception("empty pattern")
+    if len(pattern) <= native_threshold:
+        return native(text, pattern)
     occurrences: list[int] = []
-    for i in range(len(text) - len(pattern) + 1):
-        j = 0
-        while j < len(pattern) and text[i + j] == pattern[j]:
-            j += 1
-        if j == len(pattern):
+    anchor = pattern[:1]
+    length = len(pattern)
+    end = len(text) - length + 1
+    i = text.find(anchor, 0, end)
+    while i != -1:
+        if text[i : i + length] == pattern:
             occurrences.append(i)
+        i = text.find(anchor, i + 1, end)
     return occurrences
 
 
-def rabin_karp(text: bytes, pattern: bytes, alphabet: int = 256, modulus: int = 2147483647) -> list[int]:
+def rabin_karp(
+    text: bytes,
+    pattern: bytes,
+    alphabet: int = 256,
+    modulus: int = 2147483647,
+    native_threshold: int = NATIVE_THRESHOLD,
+) -> list[int]:
     """
     Rabin-Karp exact string searching algorithm.
 
@@ -45,62 +89,48 @@ def rabin_karp(text: bytes, pattern: bytes, alphabet: int = 256, modulus: int =
     - `pattern`: pattern
     - `alphabet`: size of the alphabet (max 256 because comparisons are done per byte)
     - `modulus`: modulus value use to limit the size of the hashes
+    - `native_threshold`: patterns up to this length are delegated to `native`, `0` always runs the algorithm
     - `return`: list containing the starting index of all occurrences
     """
 
-    def compute_power(pattern: bytes, alphabet: int, modulus: int) -> int:
-        """
-        Compute the largest multiplicative coefficient for a hash of length equals to `len(pattern)`.
-        """
-        power = 1
-        for _ in range(len(pattern) - 1):
-            power = (power * alphabet) % modulus
-        return power
-
-    def init_hash(text: bytes, pattern: bytes, alphabet: int, modulus: int) -> int:
+    def init_hash(text: bytes, length: int, alphabet: int, modulus: int) -> int:
         """
-        Compute initial hash for `text` using the length of `pattern`.
+        Compute initial hash for the first `length` bytes of `text`.
         """
         hash = 0
-        for i in range(len(pattern)):
+        for i in range(length):
             hash = (hash * alphabet + text[i]) % modulus
         return hash
 
-    def roll_hash(text: bytes, pattern: bytes, hash: int, power: int, i: int, alphabet: int, modulus: int) -> int:
-        """
-        Roll the current `hash` of `text[i: i + len(pattern)]` to `text[i + 1: i + len(pattern) + 1]`.
-        This is done by removing `text[index]` from the hash (which was multiplied by `power`), then multiply the hash
-        by `alphabet` to update the coefficients of the remaining values, then add `text[index+length]` to the hash.
-        """
-        return ((hash - text[i] * power) * alphabet + text[i + len(pattern)]) % modulus
-
-    def equals(text: bytes, pattern: bytes, i: int) -> bool:
-        """
-        Return `True` if `text[index:index+length] == pattern[:length]`.
-        """
-        j = 0
-        while j < len(pattern) and text[i + j] == pattern[j]:
-            j += 1
-        return j == len(pattern)
-
     if len(pattern) == 0:
         raise Exception("empty pattern")
+    if len(pattern) <= native_threshold:
+        return native(text, pattern)
     if len(text) < len(pattern):
         return []
     occurrences: list[int] = []
+    length = len(pattern)
     alphabet = min(max(2, alphabet), 256)
     modulus = max(modulus, 257)
-    power = compute_power(pattern, alphabet, modulus)
-    text_hash = init_hash(text, pattern, alphabet, modulus)
-    pattern_hash = init_hash(pattern, pattern, alphabet, modulus)
-    for i in range(len(text) - len(pattern)):
-        if text_hash == pattern_hash and equals(text, pattern, i):
-            occurrences.append(i)
-        text_hash = roll_hash(text, pattern, text_hash, power, i, alphabet, modulus)
+    # largest multiplicative coefficient of a window hash, computed by modular exponentiation in C
+    power = pow(alphabet, length - 1, modulus)
+    text_hash = init_hash(text, length, alphabet, modulus)
+    pattern_hash = init_hash(pattern, length, alphabet, modulus)
+    with memoryview(text) as view:
+        # the hash of `text[i: i + len(pattern)]` is rolled to the next window by removing the `outgoing` byte (which
+        # was multiplied by `power`), multiplying by `alphabet` to update the remaining coefficients, and adding the
+        # `incoming` byte, the last window has no incoming byte, so a dummy one is chained to also check it
+        # hash hits are verified with a slice comparison, which is a single `memcmp` in C
+        for i, outgoing, incoming in zip(itertools.count(), view, itertools.chain(view[length:], (0,))):
+            if text_hash == pattern_hash and text[i : i + length] == pattern:
+                occurrences.append(i)
+            text_hash = ((text_hash - outgoing * power) * alphabet + incoming) % modulus
     return occurrences
 
 
-def knuth_morris_pratt(text: bytes, pattern: bytes, optimized_border: bool = True) -> list[int]:
+def knuth_morris_pratt(
+    text: bytes, pattern: bytes, optimized_border: bool = True, native_threshold: int = NATIVE_THRESHOLD
+) -> list[int]:
     """
     Knuth-Morris-Pratt exact string searching algorithm.
 
@@ -114,6 +144,7 @@ def knuth_morris_pratt(text: bytes, pattern: bytes, optimized_border: bool = Tru
     - `text`: text to search for occurrences of pattern
     - `pattern`: pattern
     - `optimized_border`: use optimized border computation algorithm
+    - `native_threshold`: patterns up to this length are delegated to `native`, `0` always runs the algorithm
     - `return`: list containing the starting index of all occurrences
     """
 
@@ -134,12 +165,13 @@ def knuth_morris_pratt(text: bytes, pattern: bytes, optimized_border: bool = Tru
         """
         Optimized border computation algorithm.
         """
-        border_lengths = [0] * (len(pattern) + 1)
+        length = len(pattern)
+        border_lengths = [0] * (length + 1)
         border_lengths[0] = -1
         i = 1
         j = 0
-        while i < len(pattern):
-            while j <= i + j < len(pattern) and pattern[i + j] == pattern[j]:
+        while i < length:
+            while j <= i + j < length and pattern[i + j] == pattern[j]:
                 j += 1
                 border_lengths[i + j] = j
             i += max(1, j - border_lengths[j])
@@ -148,23 +180,29 @@ def knuth_morris_pratt(text: bytes, pattern: bytes, optimized_border: bool = Tru
 
     if len(pattern) == 0:
         raise Exception("empty pattern")
+    if len(pattern) <= native_threshold:
+        return native(text, pattern)
     occurrences: list[int] = []
     border_lengths = (
         compute_border_lengths_opt(pattern) if optimized_border else compute_border_lengths_brute_force(pattern)
     )
+    length = len(pattern)
+    last = len(text) - length
     i = 0
     j = 0
-    while i <= len(text) - len(pattern):
-        while j < len(pattern) and text[i + j] == pattern[j]:
+    while i <= last:
+        while j < length and text[i + j] == pattern[j]:
             j += 1
-        if j == len(pattern):
+        if j == length:
             occurrences.append(i)
-        i += max(1, j - border_lengths[j])
-        j = border_lengths[j - 1]
+        # the matched prefix shifts to its longest border, `border_lengths[0] == -1` shifts by one after a mismatch at 0
+        border = border_lengths[j]
+        i += j - border
+        j = border if border > 0 else 0
     return occurrences
 
 
-def baeza_yates_gonnet(text: bytes, pattern: bytes) -> list[int]:
+def baeza_yates_gonnet(text: bytes, pattern: bytes, native_threshold: int = NATIVE_THRESHOLD) -> list[int]:
     """
     Baeza-Yates–Gonnet exact string searching algorithm.
     This algorithm is also known as shift-or, shift-and, or bitap.
@@ -179,6 +217,7 @@ def baeza_yates_gonnet(text: bytes, pattern: bytes) -> list[int]:
     > parameters
     - `text`: text to search for occurrences of pattern
     - `pattern: bytes`: pattern
+    - `native_threshold`: patterns up to this length are delegated to `native`, `0` always runs the algorithm
     - `return`: list containing the starting index of all occurrences
     """
 
@@ -192,6 +231,8 @@ def baeza_yates_gonnet(text: bytes, pattern: bytes) -> list[int]:
         - `p`: length of `pattern`
         - `c`: alphabet size, fixed 256
         """
+        # a list is kept on purpose, an `array.array("Q")` table is smaller but boxes a new int on every lookup, which
+        # was measured about 70% slower in the scan loop
         char_masks = [0] * 256
         match_mask = 1 << len(pattern) - 1
         for i, byte in enumerate(pattern):
@@ -200,17 +241,24 @@ def baeza_yates_gonnet(text: bytes, pattern: bytes) -> list[int]:
 
     if len(pattern) == 0:
         raise Exception("empty pattern")
+    if len(pattern) <= native_threshold:
+        return native(text, pattern)
     occurrences: list[int] = []
     char_masks, match_mask = compute_char_masks(pattern)
     current_mask = 0
-    for i, byte in enumerate(text):
-        current_mask = ((current_mask << 1) | 1) & char_masks[byte]
-        if current_mask & match_mask != 0:
-            occurrences.append(i - len(pattern) + 1)
+    offset = len(pattern) - 1
+    with memoryview(text) as view:
+        # the table lookups are gathered by `map` in C, only the shift recurrence runs in Python
+        for i, char_mask in enumerate(map(char_masks.__getitem__, view)):
+            current_mask = ((current_mask << 1) | 1) & char_mask
+            if current_mask & match_mask:
+                occurrences.append(i - offset)
     return occurrences
 
 
-def boyer_moore(text: bytes, pattern: bytes, extended_bad_char_table: bool = True):
+def boyer_moore(
+    text: bytes, pattern: bytes, extended_bad_char_table: bool = True, native_threshold: int = NATIVE_THRESHOLD
+):
     """
     Boyer-Moore exact string searching algorithm.
 
@@ -224,17 +272,18 @@ def boyer_moore(text: bytes, pattern: bytes, extended_bad_char_table: bool = Tru
     > parameters
     - `text`: text to search for occurrences of pattern
     - `pattern`: pattern
+    - `native_threshold`: patterns up to this length are delegated to `native`, `0` always runs the algorithm
     - `return`: list containing the starting index of all occurrences
     """
 
-    def compute_basic_bad_char_table(pattern: bytes) -> list[list[int]]:
+    def compute_basic_bad_char_table(pattern: bytes) -> list[int]:
         """
         Compute the basic bad character table.
         Basic bad character table contains the index of the last occurrence of a character in the pattern.
         If the mismatch index is smaller than the last occurrence index, this table proposes a backward shift
         (or negative shift), which must be ignored by shifting +1 forward.
         The extended table does not have this issue.
-        This table is placed inside another list for compatibility with the extended table.
+        This table has a single row, indexed by character, the same layout as one row of the extended table.
 
         Example:
         ```
@@ -260,14 +309,16 @@ def boyer_moore(text: bytes, pattern: bytes, extended_bad_char_table: bool = Tru
         table = [-1] * 256
         for i, byte in enumerate(pattern):
             table[byte] = i
-        return [table]
+        return table
 
-    def compute_extended_bad_char_table(pattern: bytes) -> list[list[int]]:
+    def compute_extended_bad_char_table(pattern: bytes) -> list[int]:
         """
         Compute the extended bad character table.
         Extended bad character table contains the index of the last occurrence of a character in the pattern for each
         prefix (after mismatch index) of the pattern.
         This allows finding more skips when larger sequences were already matched before, but it uses `p` space.
+        The rows are stored in a single flat list, the row of mismatch index `j` starts at `j * 256`, each row is built
+        by a C-level copy of the previous one, and lookups are a single list index.
 
         Example:
         ```
@@ -304,12 +355,10 @@ def boyer_moore(text: bytes, pattern: bytes, extended_bad_char_table: bool = Tru
         - `p`: length of `pattern`
         - `c`: alphabet size, fixed 256
         """
-        table = [[-1] * 256]
-        for i in range(len(pattern)):
-            byte = pattern[i]
-            prefix_table = table[i][:]
-            prefix_table[byte] = i
-            table.append(prefix_table)
+        table = [-1] * 256
+        for i, byte in enumerate(pattern):
+            table += table[-256:]
+            table[(i + 1) * 256 + byte] = i
         return table
 
     def compute_good_suffix_table(pattern: bytes) -> list[int]:
@@ -344,33 +393,58 @@ def boyer_moore(text: bytes, pattern: bytes, extended_bad_char_table: bool = Tru
 
     if len(pattern) == 0:
         raise Exception("empty pattern")
+    if len(pattern) <= native_threshold:
+        return native(text, pattern)
     occurrences: list[int] = []
     bad_char_table = (
         compute_extended_bad_char_table(pattern) if extended_bad_char_table else compute_basic_bad_char_table(pattern)
     )
     good_suffix_table = compute_good_suffix_table(pattern)
+    length = len(pattern)
+    last = len(text) - length
+    match_shift = good_suffix_table[0]
     i = 0
-    while i <= len(text) - len(pattern):
-        j = len(pattern) - 1
-        while j >= 0 and text[i + j] == pattern[j]:
-            j -= 1
-        if j < 0:
-            occurrences.append(i)
-            i += good_suffix_table[0]
-            continue
-        i += max(j - bad_char_table[j % len(bad_char_table)][text[i + j]], good_suffix_table[j + 1])
+    # the scans are split by table, so the extended row offset is computed only when it is used
+    # the extended and good suffix tables are not combined into a single table of shifts, building it costs `O(p*c)`
+    # Python operations, more than the lookup it saves per mismatch unless `text` is much longer than the table
+    if extended_bad_char_table:
+        while i <= last:
+            j = length - 1
+            while j >= 0 and text[i + j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                occurrences.append(i)
+                i += match_shift
+                continue
+            bad_char_shift = j - bad_char_table[(j << 8) + text[i + j]]
+            good_suffix_shift = good_suffix_table[j + 1]
+            i += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+    else:
+        while i <= last:
+            j = length - 1
+            while j >= 0 and text[i + j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                occurrences.append(i)
+                i += match_shift
+                continue
+            bad_char_shift = j - bad_char_table[text[i + j]]
+            good_suffix_shift = good_suffix_table[j + 1]
+            i += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
     return occurrences
 
 
 def aho_corasick(text: bytes, patterns: list[bytes]) -> dict[bytes, list[int]]:
     """
     Aho-Corasick string exact multi string searching algorithm.
+    The automaton is resolved into a flat transition table, so the search takes one table lookup per byte of text.
 
     > complexity
-    - time: `O(n + p)`
-    - space: `O(p)`
+    - time: `O(n + p*c)`
+    - space: `O(p*c)`
     - `n`: length of `text`
     - `p`: sum of the lengths of all `patterns`
+    - `c`: alphabet size, fixed 256
 
     > parameters
     - `text`: text to search for occurrences of pattern
@@ -416,60 +490,64 @@ def aho_corasick(text: bytes, patterns: list[bytes]) -> dict[bytes, list[int]]:
                 trie[(0, byte)] = 0
         return trie, goals
 
-    def build_fail(trie: dict[tuple[int, int], int], goals: list[list[bytes]]) -> tuple[list[int], list[list[bytes]]]:
+    def build_dfa(trie: dict[tuple[int, int], int], goals: list[list[bytes]]) -> tuple[list[int], list[list[bytes]]]:
         """
-        Build all trie fail links, and update goals when fails happen in goal vertices.
+        Build the trie fail links, and resolve them into a deterministic automaton, also update goals when fails happen
+        in goal vertices.
+        The automaton is a flat transition list, the transition of vertex `v` with byte `c` is at `v * 256 + c`. Fail
+        links are followed once per vertex and byte during the build, so the search takes exactly one transition per
+        byte of text.
 
         > complexity
-        - time: `O(p)`
+        - time: `O(p*c)`
         - space: `O(p*c)`
-        - `p`: length of `pattern`
+        - `p`: sum of the lengths of all `patterns`
         - `c`: alphabet size, fixed 256
 
         > parameters
         - `trie`: the trie computed in `build_goto`
         - `goals`: the goals computed in `build_goto`
-        - `return`: tuple containing the fail links and goals vertices updated
+        - `return`: tuple containing the transitions and goals vertices updated
         """
         vertices = len(goals)
         fail = [0] * vertices
+        transitions = [0] * (vertices * 256)
         queue = collections.deque[int]()
         for byte in range(256):
+            transitions[byte] = trie[(0, byte)]
             if trie[(0, byte)] != 0:
                 queue.append(trie[(0, byte)])
-                fail[trie[(0, byte)]] = 0
         while len(queue) > 0:
             cursor = queue.popleft()
+            base = cursor * 256
+            fail_base = fail[cursor] * 256
             for byte in range(256):
                 if (cursor, byte) not in trie:
+                    transitions[base + byte] = transitions[fail_base + byte]
                     continue
                 next = trie[(cursor, byte)]
+                transitions[base + byte] = next
                 queue.append(next)
-                brd = fail[cursor]
-                while (brd, byte) not in trie:
-                    brd = fail[brd]
-                fail[next] = trie[(brd, byte)]
+                fail[next] = transitions[fail_base + byte]
                 goals[next].extend(goals[fail[next]])
-        return fail, goals
+        return transitions, goals
 
-    def build_fsa(patterns: list[bytes]) -> tuple[dict[tuple[int, int], int], list[int], list[list[bytes]]]:
+    def build_fsa(patterns: list[bytes]) -> tuple[list[int], list[list[bytes]]]:
         """
-        Call `build_goto` and `build_fail` to create the aho corasick finite state automaton.
-        The automaton is composed of a trie containing only forward links, a list contaning fail links, and the goals.
+        Call `build_goto` and `build_dfa` to create the aho corasick finite state automaton.
+        The automaton is composed of a flat transition list, and the goals.
         """
         trie, goals = build_goto(patterns)
-        fail, goals = build_fail(trie, goals)
-        return trie, fail, goals
+        return build_dfa(trie, goals)
 
     occurrences: dict[bytes, list[int]] = {pattern: [] for pattern in patterns}
-    trie, fail, goals = build_fsa(patterns)
+    transitions, goals = build_fsa(patterns)
     cursor = 0
-    for i, byte in enumerate(text):
-        while (cursor, byte) not in trie:
-            cursor = fail[cursor]
-        cursor = trie[(cursor, byte)]
-        for pattern in goals[cursor]:
-            occurrences[pattern].append(i - len(pattern) + 1)
+    with memoryview(text) as view:
+        for i, byte in enumerate(view):
+            cursor = transitions[(cursor << 8) + byte]
+            for pattern in goals[cursor]:
+                occurrences[pattern].append(i - len(pattern) + 1)
     return occurrences
 
 
@@ -481,25 +559,18 @@ def test():
     def random_bytes(size: int, alphabet_size: int) -> bytes:
         return bytes(random.randint(0, alphabet_size - 1) for _ in range(size))
 
-    def test_native_search(text: bytes, pattern: bytes):
-        occurrences: list[int] = []
-        i = -1
-        while (i := text.find(pattern, i + 1)) != -1:
-            occurrences.append(i)
-        return occurrences
-
     print("alphabet size = 4")
     benchmark(
         (
-            ("           brute force", lambda args: brute_force(*args)),
-            ("            rabin karp", lambda args: rabin_karp(*args)),
-            ("    knuth morris pratt", lambda args: knuth_morris_pratt(*args, False)),
-            ("knuth morris pratt opt", lambda args: knuth_morris_pratt(*args, True)),
-            ("    baeza yates gonnet", lambda args: baeza_yates_gonnet(*args)),
-            ("           boyer moore", lambda args: boyer_moore(*args, False)),
-            ("       boyer moore opt", lambda args: boyer_moore(*args, True)),
+            ("           brute force", lambda args: brute_force(*args, native_threshold=0)),
+            ("            rabin karp", lambda args: rabin_karp(*args, native_threshold=0)),
+            ("    knuth morris pratt", lambda args: knuth_morris_pratt(*args, False, native_threshold=0)),
+            ("knuth morris pratt opt", lambda args: knuth_morris_pratt(*args, True, native_threshold=0)),
+            ("    baeza yates gonnet", lambda args: baeza_yates_gonnet(*args, native_threshold=0)),
+            ("           boyer moore", lambda args: boyer_moore(*args, False, native_threshold=0)),
+            ("       boyer moore opt", lambda args: boyer_moore(*args, True, native_threshold=0)),
             ("          aho corasick", lambda args: aho_corasick(args[0], [args[1]])),
-            ("                native", lambda args: test_native_search(*args)),
+            ("                native", lambda args: native(*args)),
         ),
         test_inputs=((b"hello world!", b"o w"), (b"cagtcatgcatacgtctatatcggctgc", b"cat")),
         bench_sizes=((1000, 1), (1000, 5), (1000, 10), (1000, 20), (10000, 1), (10000, 5), (10000, 10), (10000, 20)),
@@ -508,15 +579,15 @@ def test():
     print("alphabet size = 256")
     benchmark(
         (
-            ("           brute force", lambda args: brute_force(args[0], args[1])),
-            ("            rabin karp", lambda args: rabin_karp(args[0], args[1])),
-            ("    knuth morris pratt", lambda args: knuth_morris_pratt(args[0], args[1], False)),
-            ("knuth morris pratt opt", lambda args: knuth_morris_pratt(args[0], args[1], True)),
-            ("    baeza yates gonnet", lambda args: baeza_yates_gonnet(args[0], args[1])),
-            ("           boyer moore", lambda args: boyer_moore(args[0], args[1], False)),
-            ("       boyer moore opt", lambda args: boyer_moore(args[0], args[1], True)),
+            ("           brute force", lambda args: brute_force(args[0], args[1], native_threshold=0)),
+            ("            rabin karp", lambda args: rabin_karp(args[0], args[1], native_threshold=0)),
+            ("    knuth morris pratt", lambda args: knuth_morris_pratt(args[0], args[1], False, native_threshold=0)),
+            ("knuth morris pratt opt", lambda args: knuth_morris_pratt(args[0], args[1], True, native_threshold=0)),
+            ("    baeza yates gonnet", lambda args: baeza_yates_gonnet(args[0], args[1], native_threshold=0)),
+            ("           boyer moore", lambda args: boyer_moore(args[0], args[1], False, native_threshold=0)),
+            ("       boyer moore opt", lambda args: boyer_moore(args[0], args[1], True, native_threshold=0)),
             ("          aho corasick", lambda args: aho_corasick(args[0], [args[1]])),
-            ("                native", lambda args: test_native_search(*args)),
+            ("                native", lambda args: native(*args)),
         ),
         test_inputs=(),
         bench_sizes=((1000, 1), (1000, 5), (1000, 10), (1000, 20), (10000, 1), (10000, 5), (10000, 10), (10000, 20)),
@@ -5,16 +5,20 @@ import random
 def bogosort_random(array: list[float]) -> list[float]:
     """
     Sort `array` using randomized bogosort.
+    Shuffles are checked against a sorted copy of `array`, the list comparison runs in C and stops at the first
+    mismatch.
 
     > complexity
     - time: `unbounded`
-    - space: `O(1)`
+    - space: `O(n)`
+    - `n`: length of `array`
 
     > parameters
     - `array`: array to be sorted
     - `return`: `array` sorted
     """
-    while any(array[i] > array[i + 1] for i in range(len(array) - 1)):
+    target = sorted(array)
+    while array != target:
         random.shuffle(array)
     return array
 
@@ -22,6 +26,8 @@ def bogosort_random(array: list[float]) -> list[float]:
 def bogosort_deterministic(array: list[float]) -> list[float]:
     """
     Sort `array` using deterministic bogosort.
+    Permutations are checked against a sorted copy of `array`, the tuple comparison runs in C and stops at the first
+    mismatch.
 
     > complexity
     - time: `O((n + 1)!)`
@@ -32,11 +38,11 @@ def bogosort_deterministic(array: list[float]) -> list[float]:
     - `array`: array to be sorted
     - `return`: `array` sorted
     """
+    target = tuple(sorted(array))
     for permutation in itertools.permutations(array):
-        if all(permutation[i] <= permutation[i + 1] for i in range(len(permutation) - 1)):
-            continue
-        array[:] = permutation
-        break
+        if permutation == target:
+            array[:] = permutation
+            break
     return array
 
 
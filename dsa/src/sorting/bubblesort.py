@@ -1,9 +1,11 @@
 def bubblesort(array: list[float]) -> list[float]:
     """
     Sort `array` using bublesort.
+    Each pass stops at the last swap of the previous pass, values after it are already in their final positions, and
+    the sort ends after a pass without swaps.
 
     > complexity
-    - time: `O(n**2)`
+    - time: `O(n**2)`, sorted arrays: `O(n)`
     - space: `O(1)`
     - `n`: length of `array`
 
@@ -11,10 +13,14 @@ def bubblesort(array: list[float]) -> list[float]:
     - `array`: array to be sorted
     - `return`: `array` sorted
     """
-    for i in range(len(array) - 1, -1, -1):
-        for j in range(0, i):
+    end = len(array) - 1
+    while end > 0:
+        last_swap = 0
+        for j in range(end):
             if array[j] > array[j + 1]:
                 array[j], array[j + 1] = array[j + 1], array[j]
+                last_swap = j
+        end = last_swap
     return array
 
 
@@ -1,4 +1,5 @@
-from typing import Callable, Optional
+import itertools
+from typing import Any, Callable, Optional, cast
 
 from .insertionsort import insertionsort
 
@@ -8,6 +9,7 @@ def bucketsort(
 ):
     """
     Sort `array` using bucketsort.
+    Buckets are concatenated back into `array` by `itertools.chain`, without a Python-level loop over the values.
 
     > complexity
     - time: average: `O(n + (n**2/k) + k)`, worst `O(n**2)`, best: `O(n)` if `n ~ k` and uniform distribution.
@@ -26,30 +28,34 @@ def bucketsort(
     k = max(k if k is not None else len(array), 1)
     min_value = min(array)
     max_value = max(array)
-    value_range = max_value - min_value + 1
+    scale = k / (max_value - min_value + 1)
     buckets: list[list[float]] = [[] for _ in range(k)]
+    # computing indices with `map` chains and calling pre-bound `append` methods is slower, binding `k` methods costs
+    # more than the attribute lookups it saves
     for value in array:
-        buckets[int((value - min_value) / value_range * k)].append(value)
+        buckets[int((value - min_value) * scale)].append(value)
     for bucket in buckets:
         subsort(bucket)
-    array[:] = (value for bucket in buckets for value in bucket)
+    array[:] = itertools.chain.from_iterable(buckets)
     return array
 
 
 def test():
     from ..test import sort_benchmark
+    from .radixsort import radixsort_lsd
 
     sort_benchmark(
         (
-            (" bucketsort k=8*n", lambda array: bucketsort(array, len(array) * 8)),
-            (" bucketsort k=4*n", lambda array: bucketsort(array, len(array) * 4)),
-            (" bucketsort k=2*n", lambda array: bucketsort(array, len(array) * 2)),
-            ("   bucketsort k=n", lambda array: bucketsort(array)),
-            (" bucketsort k=n/2", lambda array: bucketsort(array, len(array) // 2)),
-            (" bucketsort k=n/4", lambda array: bucketsort(array, len(array) // 4)),
-            (" bucketsort k=n/8", lambda array: bucketsort(array, len(array) // 8)),
-            ("bucketsort k=n/16", lambda array: bucketsort(array, len(array) // 16)),
-            ("bucketsort k=n/32", lambda array: bucketsort(array, len(array) // 32)),
+            ("     bucketsort k=8*n", lambda array: bucketsort(array, len(array) * 8)),
+            ("     bucketsort k=4*n", lambda array: bucketsort(array, len(array) * 4)),
+            ("     bucketsort k=2*n", lambda array: bucketsort(array, len(array) * 2)),
+            ("       bucketsort k=n", lambda array: bucketsort(array)),
+            ("     bucketsort k=n/2", lambda array: bucketsort(array, len(array) // 2)),
+            ("     bucketsort k=n/4", lambda array: bucketsort(array, len(array) // 4)),
+            ("     bucketsort k=n/8", lambda array: bucketsort(array, len(array) // 8)),
+            ("    bucketsort k=n/16", lambda array: bucketsort(array, len(array) // 16)),
+            ("    bucketsort k=n/32", lambda array: bucketsort(array, len(array) // 32)),
+            ("radixsort lsd block=8", lambda array: cast(Any, radixsort_lsd)(array, 8)),
         ),
     )
 
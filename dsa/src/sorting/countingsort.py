@@ -1,3 +1,4 @@
+import itertools
 from typing import Any, cast
 
 
@@ -6,6 +7,8 @@ def countingsort(array: list[int]) -> list[int]:
     Sort `array` using countingsort.
     This implementation only supports integer values.
     `bucketsort` can be used for floating-point values.
+    Equal integers are indistinguishable, so each value is written back as a run of its frequency instead of placing
+    values one at a time through prefix sums, the runs are chained in C by `itertools`, skipping absent values.
 
     > complexity
     - time: `O(n + k)`
@@ -23,32 +26,33 @@ def countingsort(array: list[int]) -> list[int]:
     max_value = max(array)
     value_range = max_value - min_value + 1
     frequencies = [0] * value_range
+    # a `collections.Counter` tally is counted in C, but moving its counts into `frequencies` is slower than this loop
     for value in array:
         frequencies[value - min_value] += 1
-    for i in range(1, len(frequencies)):
-        frequencies[i] += frequencies[i - 1]
-    output = [0] * len(array)
-    for value in array:
-        output[frequencies[value - min_value] - 1] = value
-        frequencies[value - min_value] -= 1
-    array[:] = output
+    values = itertools.compress(range(min_value, max_value + 1), frequencies)
+    array[:] = itertools.chain.from_iterable(map(itertools.repeat, values, filter(None, frequencies)))
     return array
 
 
 def test():
     from ..test import sort_benchmark
+    from .radixsort import radixsort_lsd
 
+    algorithms = (
+        ("         countingsort", cast(Any, countingsort)),
+        ("radixsort lsd block=8", lambda array: cast(Any, radixsort_lsd)(array, 8)),
+    )
     print("terrible input")
-    sort_benchmark((("countingsort", cast(Any, countingsort)),), value_range=lambda s: (-s * 10, s * 10))
+    sort_benchmark(algorithms, value_range=lambda s: (-s * 10, s * 10))
     print()
     print("bad input")
-    sort_benchmark((("countingsort", cast(Any, countingsort)),), value_range=lambda s: (-s * 5, s * 5))
+    sort_benchmark(algorithms, value_range=lambda s: (-s * 5, s * 5))
     print()
     print("good input")
-    sort_benchmark((("countingsort", cast(Any, countingsort)),), value_range=lambda s: (-s, s))
+    sort_benchmark(algorithms, value_range=lambda s: (-s, s))
     print()
     print("best input")
-    sort_benchmark((("countingsort", cast(Any, countingsort)),), value_range=lambda s: (-10, 10))
+    sort_benchmark(algorithms, value_range=lambda s: (-10, 10))
     print()
 
 
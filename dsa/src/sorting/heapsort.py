@@ -3,6 +3,7 @@ def sift_down(heap: list[float], i: int, length: int):
     Heap sift down algorithm.
     Appart from the sift down in the heap.py module, this one uses direct numeric comparisons rather than comparators
     and is max only.
+    The element is kept aside while the greatest children are moved up, and is written only once at its final position.
 
     > complexity
     - time: `O(log(n))`
@@ -14,15 +15,16 @@ def sift_down(heap: list[float], i: int, length: int):
     - `i`: index of value in `heap` to sift down
     - `length`: virtual length of the heap, may be smaller than or equals to len(heap)`
     """
-    while (left := i * 2 + 1) < length:
-        right = left + 1
-        chosen = i
-        chosen = left if heap[left] > heap[chosen] else chosen
-        chosen = right if right < length and heap[right] > heap[chosen] else chosen
-        if chosen == i:
+    item = heap[i]
+    while (child := i * 2 + 1) < length:
+        right = child + 1
+        if right < length and heap[right] > heap[child]:
+            child = right
+        if not heap[child] > item:
             break
-        heap[i], heap[chosen] = heap[chosen], heap[i]
-        i = chosen
+        heap[i] = heap[child]
+        i = child
+    heap[i] = item
 
 
 def heapsort(array: list[float]) -> list[float]:
@@ -41,7 +43,7 @@ def heapsort(array: list[float]) -> list[float]:
     length = len(array)
     for i in range(length // 2 - 1, -1, -1):
         sift_down(array, i, length)
-    for i in range(len(array) - 1, 0, -1):
+    for i in range(length - 1, 0, -1):
         array[0], array[i] = array[i], array[0]
         sift_down(array, 0, i)
     return array
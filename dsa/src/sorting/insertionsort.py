@@ -1,30 +1,66 @@
-def insertionsort(array: list[float]) -> list[float]:
+import bisect
+
+
+def insertionsort_range(array: list[float], left: int, right: int) -> list[float]:
+    """
+    Sort the range `array[left : right + 1]` using binary insertionsort.
+    The insertion point of each value is found by a binary search in C (`bisect`), after the equal values to keep the
+    sort stable, then the values in between are shifted with a single slice assignment, a C-level `memmove`, instead of
+    one Python assignment per value.
+    Values not smaller than their predecessor are already in place and skip the search.
+
+    > complexity
+    - time: `O(n**2)` (`O(n*log(n))` comparisons), sorted arrays: `O(n)`
+    - space: `O(n)`
+    - `n`: length of the range
+
+    > parameters
+    - `array`: array containing the range to be sorted
+    - `left`: first index of the range
+    - `right`: last index of the range
+    - `return`: `array` with the range sorted
+    """
+    for i in range(left + 1, right + 1):
+        key = array[i]
+        if not array[i - 1] > key:
+            continue
+        j = bisect.bisect_right(array, key, left, i - 1)
+        array[j + 1 : i + 1] = array[j:i]
+        array[j] = key
+    return array
+
+
+def insertionsort(array: list[float], fast: bool = False) -> list[float]:
     """
     Sort `array` using insertionsort.
+    Check `insertionsort_range`.
 
     > complexity
     - time: `O(n**2)`
-    - space: `O(1)`
+    - space: `O(n)`
     - `n`: length of `array`
 
     > parameters
     - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
     - `return`: `array` sorted
     """
-    for i in range(1, len(array)):
-        key = array[i]
-        j = i - 1
-        while j >= 0 and array[j] > key:
-            array[j + 1] = array[j]
-            j -= 1
-        array[j + 1] = key
-    return array
+    if fast:
+        array.sort()
+        return array
+    return insertionsort_range(array, 0, len(array) - 1)
 
 
 def test():
     from ..test import sort_benchmark
 
-    sort_benchmark((("insertionsort", insertionsort),), bench_sizes=(0, 1, 10, 100, 1000))
+    sort_benchmark(
+        (
+            ("     insertionsort", insertionsort),
+            ("insertionsort fast", lambda array: insertionsort(array, True)),
+        ),
+        bench_sizes=(0, 1, 10, 100, 1000),
+    )
 
 
 if __name__ == "__main__":
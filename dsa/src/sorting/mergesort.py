@@ -1,52 +1,288 @@
-def mergesort(array: list[float]) -> list[float]:
+import bisect
+import concurrent.futures
+import itertools
+import os
+from typing import Optional
+
+from .insertionsort import insertionsort_range
+
+# length of the blocks sorted by insertionsort before merging, insertionsort shifts values with slice assignments, so
+# short blocks are sorted faster than by the first merge passes
+INSERTION_BLOCK = 64
+PARALLEL_THRESHOLD = 100000
+
+
+def rotate(array: list[float], first: int, middle: int, last: int):
+    """
+    Rotate `array[first:last]` in place, so `array[middle]` becomes `array[first]`, by reversing both sides and then the
+    whole range. Values are swapped one by one, slices are not used because they copy the values.
+
+    > complexity
+    - time: `O(n)`
+    - space: `O(1)`
+    - `n`: `last - first`
+
+    > parameters
+    - `array`: array to be rotated
+    - `first`: first index of the range
+    - `middle`: index of the value moved to `first`
+    - `last`: index after the end of the range
+    """
+    for left, right in ((first, middle - 1), (middle, last - 1), (first, last - 1)):
+        while left < right:
+            array[left], array[right] = array[right], array[left]
+            left += 1
+            right -= 1
+
+
+def merge_in_place(array: list[float], first: int, middle: int, last: int):
     """
-    Sort `array` using mergesort.
+    Merge the sorted runs `array[first:middle]` and `array[middle:last]` using symmerge, without a temporary copy.
+    A binary search finds the longest suffix of the left run and prefix of the right run, around the center of the
+    range, that must swap sides, they are exchanged with `rotate` and both halves of the range are merged recursively.
 
     > complexity
     - time: `O(n*log(n))`
+    - space: `O(log(n))`
+    - `n`: `last - first`
+
+    > parameters
+    - `array`: array containing the runs
+    - `first`: first index of the left run
+    - `middle`: first index of the right run
+    - `last`: index after the end of the right run
+    """
+    if middle - first == 1:
+        rotate(array, first, middle, bisect.bisect_left(array, array[first], middle, last))
+        return
+    if last - middle == 1:
+        rotate(array, bisect.bisect_right(array, array[middle], first, middle), middle, last)
+        return
+    center = (first + last) // 2
+    total = center + middle
+    start, end = (total - last, center) if middle > center else (first, middle)
+    while start < end:
+        i = (start + end) // 2
+        if not array[total - 1 - i] < array[i]:
+            start = i + 1
+        else:
+            end = i
+    end = total - start
+    if start < middle < end:
+        rotate(array, start, middle, end)
+    if first < start < center:
+        merge_in_place(array, first, start, center)
+    if center < end < last:
+        merge_in_place(array, center, end, last)
+
+
+def merge_runs(array: list[float], width: int, in_place: bool = False) -> list[float]:
+    """
+    Merge the consecutive sorted runs of `width` values in `array` (the last run may be shorter) until it is sorted.
+    Runs are merged in pairs, doubling `width` at each pass, without recursive calls.
+    Only the left run is copied to `temp`, merged values are written from the start of the left run and never overtake
+    the unread values of the right run. Copies are slice assignments, which run in C, only the merge of the two runs
+    compares values in Python.
+    If `in_place` is set, runs are merged by `merge_in_place` instead, which does not copy runs but moves values many
+    more times, it is meant for arrays where memory, not time, is the limit.
+
+    > complexity
+    - time: `O(n*log(n/w))`, in place: `O(n*log(n)*log(n/w))`
+    - space: `O(n)`, in place: `O(log(n))`
+    - `n`: length of `array`
+    - `w`: initial `width`
+
+    > parameters
+    - `array`: array containing sorted runs
+    - `width`: length of the runs
+    - `in_place`: merge runs without temporary copies
+    - `return`: `array` sorted
+    """
+    length = len(array)
+    while width < length:
+        for left in range(0, length - width, width * 2):
+            center = left + width
+            right = min(center + width, length)
+            if in_place:
+                merge_in_place(array, left, center, right)
+                continue
+            temp = array[left:center]
+            left_index = 0
+            right_index = center
+            i = left
+            # a branchless step (indices advanced by the comparison result) is slower in the interpreter, where the
+            # branch is a bytecode jump rather than a mispredicted cpu branch
+            while left_index < width and right_index < right:
+                if temp[left_index] <= array[right_index]:
+                    array[i] = temp[left_index]
+                    left_index += 1
+                else:
+                    array[i] = array[right_index]
+                    right_index += 1
+                i += 1
+            # leftovers of the right run are already in place, leftovers of the left run fill the gap before them
+            array[i : i + width - left_index] = temp[left_index:]
+        width *= 2
+    return array
+
+
+def mergesort(array: list[float], fast: bool = False, in_place: bool = False) -> list[float]:
+    """
+    Sort `array` using bottom-up mergesort.
+    Blocks of `INSERTION_BLOCK` values are sorted with insertionsort, then merged by `merge_runs`.
+
+    > complexity
+    - time: `O(n*log(n))`, in place: `O(n*log(n)**2)`
+    - space: `O(n)`, in place: `O(log(n))`
+    - `n`: length of `array`
+
+    > parameters
+    - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
+    - `in_place`: merge runs without temporary copies, check `merge_runs`
+    - `return`: `array` sorted
+    """
+    if fast:
+        array.sort()
+        return array
+    length = len(array)
+    for left in range(0, length, INSERTION_BLOCK):
+        insertionsort_range(array, left, min(left + INSERTION_BLOCK, length) - 1)
+    return merge_runs(array, INSERTION_BLOCK, in_place)
+
+
+def mergesort_parallel(
+    array: list[float], workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD
+) -> list[float]:
+    """
+    Sort `array` using mergesort in multiple processes.
+    `array` is split in one run per worker, the runs are sorted by `mergesort` in a process pool, bypassing the GIL, and
+    merged back in this process by `merge_runs`.
+    Runs are pickled to and from the workers, so arrays shorter than `threshold`, where starting processes and copying
+    runs cost more than they save, are sorted in this process.
+
+    > complexity
+    - time: `O((n/w)*log(n/w) + n*log(w))`
+    - space: `O(n)`
+    - `n`: length of `array`
+    - `w`: number of workers
+
+    > parameters
+    - `array`: array to be sorted
+    - `workers`: number of processes, defaults to the number of cpus
+    - `threshold`: smallest length of `array` sorted in multiple processes
+    - `return`: `array` sorted
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    length = len(array)
+    if workers < 2 or length < max(threshold, workers):
+        return mergesort(array)
+    width = -(-length // workers)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        runs = executor.map(mergesort, (array[i : i + width] for i in range(0, length, width)))
+        array[:] = itertools.chain.from_iterable(runs)
+    return merge_runs(array, width)
+
+
+def mergesort_natural(array: list[float]) -> list[float]:
+    """
+    Sort `array` using natural mergesort.
+    `array` is split in maximal ascending or strictly descending runs in a single scan, descending runs are reversed
+    in place (strictly, to keep the sort stable).
+    Runs are pushed into a stack, which is collapsed following timsort invariants, keeping the merges balanced.
+    Before merging, values of the left run not greater than the first value of the right run and values of the right
+    run not smaller than the last value of the left run are skipped with binary searches (`bisect`), they are already in
+    place, and only the remaining values of the left run are copied.
+
+    > complexity
+    - time: `O(n*log(r))`, sorted and reversed arrays: `O(n)`
     - space: `O(n)`
     - `n`: length of `array`
+    - `r`: number of runs in `array`
 
     > parameters
     - `array`: array to be sorted
     - `return`: `array` sorted
     """
 
-    def rec(array: list[float], left: int, right: int, temp: list[float]):
-        center = (left + right) // 2
-        if right - left + 1 > 2:
-            rec(array, left, center, temp)
-            rec(array, center + 1, right, temp)
-        for i in range(left, right + 1):
-            temp[i] = array[i]
-        left_index = left
-        right_index = center + 1
+    def merge(left: int, center: int, right: int):
+        """
+        Merge the runs `array[left:center]` and `array[center:right]`.
+        """
+        left = bisect.bisect_right(array, array[center], left, center)
+        right = bisect.bisect_left(array, array[center - 1], center, right)
+        if left == center:
+            return
+        temp = array[left:center]
+        length = center - left
+        left_index = 0
+        right_index = center
         i = left
-        while left_index <= center and right_index <= right:
-            if temp[left_index] <= temp[right_index]:
+        while left_index < length and right_index < right:
+            if array[right_index] < temp[left_index]:
+                array[i] = array[right_index]
+                right_index += 1
+            else:
                 array[i] = temp[left_index]
                 left_index += 1
-            else:
-                array[i] = temp[right_index]
-                right_index += 1
-            i += 1
-        while left_index <= center:
-            array[i] = temp[left_index]
-            left_index += 1
-            i += 1
-        while right_index <= right:
-            array[i] = temp[right_index]
-            right_index += 1
             i += 1
+        # leftovers of the right run are already in place, leftovers of the left run fill the gap before them
+        array[i : i + length - left_index] = temp[left_index:]
+
+    def merge_at(i: int):
+        """
+        Merge the runs at `i` and `i + 1` in the stack of runs.
+        """
+        start, length = runs[i]
+        runs[i] = (start, length + runs[i + 1][1])
+        merge(start, start + length, start + runs[i][1])
+        del runs[i + 1]
 
-    rec(array, 0, len(array) - 1, array.copy())
+    runs: list[tuple[int, int]] = []
+    length = len(array)
+    start = 0
+    while start < length:
+        end = start + 1
+        if end < length and array[end] < array[start]:
+            while end < length and array[end] < array[end - 1]:
+                end += 1
+            array[start:end] = array[start:end][::-1]
+        else:
+            while end < length and not array[end] < array[end - 1]:
+                end += 1
+        runs.append((start, end - start))
+        start = end
+        # collapse the stack until run lengths decrease faster than fibonacci numbers from bottom to top
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or (
+                i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]
+            ):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            merge_at(i)
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(i)
     return array
 
 
 def test():
     from ..test import sort_benchmark
 
-    sort_benchmark((("mergesort", mergesort),))
+    sort_benchmark(
+        (
+            ("         mergesort", mergesort),
+            ("    mergesort fast", lambda array: mergesort(array, True)),
+            ("mergesort in place", lambda array: mergesort(array, in_place=True)),
+            ("mergesort parallel", mergesort_parallel),
+            (" mergesort natural", mergesort_natural),
+        )
+    )
 
 
 if __name__ == "__main__":
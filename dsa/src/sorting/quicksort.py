@@ -1,28 +1,51 @@
 import math
 
+from .insertionsort import insertionsort_range
 
-def quicksort_hoare(array: list[float]) -> list[float]:
+# partitions smaller than the threshold are sorted by insertionsort, it must be at least 1, so partitioning always
+# receives two or more values
+INSERTION_THRESHOLD = 16
+
+
+def quicksort_hoare(array: list[float], fast: bool = False) -> list[float]:
     """
     Sort `array` using quicksort with Hoare's partition algorithm.
-    The center element is used as pivot.
+    The median of the first, center and last elements is used as pivot, the three elements are sorted in place, so the
+    first and last elements already belong to their partitions and stop the scans.
     Random pivot is not used because python random functions are very slow.
+    Partitions are kept in an explicit stack instead of recursive calls, the largest partition is pushed first, so the
+    smaller ones are sorted first and the stack never holds more than `O(log(n))` partitions.
+    Partitions smaller than `INSERTION_THRESHOLD` are sorted with insertionsort.
 
     > complexity
     - time: average: `O(n*log(n))`, worst: `O(n**2)`
-    - space: average: `O(log(n))`, worst: `O(n)`
+    - space: `O(log(n))`
     - `n`: length of `array`
 
     > parameters
     - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
     - `return`: `array` sorted
     """
-
-    def rec(array: list[float], left: int, right: int):
-        if left >= right:
-            return
-        pivot = array[(left + right) // 2]
-        left_index = left
-        right_index = right
+    if fast:
+        array.sort()
+        return array
+    stack = [(0, len(array) - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left < INSERTION_THRESHOLD:
+            insertionsort_range(array, left, right)
+            continue
+        center = (left + right) // 2
+        if array[center] < array[left]:
+            array[left], array[center] = array[center], array[left]
+        if array[right] < array[center]:
+            array[center], array[right] = array[right], array[center]
+            if array[center] < array[left]:
+                array[left], array[center] = array[center], array[left]
+        pivot = array[center]
+        left_index = left + 1
+        right_index = right - 1
         while True:
             while array[left_index] < pivot:
                 left_index += 1
@@ -33,32 +56,43 @@ def quicksort_hoare(array: list[float]) -> list[float]:
             array[left_index], array[right_index] = array[right_index], array[left_index]
             left_index += 1
             right_index -= 1
-        rec(array, left, right_index)
-        rec(array, right_index + 1, right)
-
-    rec(array, 0, len(array) - 1)
+        if right_index - left < right - right_index:
+            stack.append((right_index + 1, right))
+            stack.append((left, right_index))
+        else:
+            stack.append((left, right_index))
+            stack.append((right_index + 1, right))
     return array
 
 
-def quicksort_lomuto(array: list[float]) -> list[float]:
+def quicksort_lomuto(array: list[float], fast: bool = False) -> list[float]:
     """
     Sort `array` using quicksort with Lomuto's partition algorithm.
     The center element is used as pivot.
     Random pivot is not used because python random functions are very slow.
+    Partitions are kept in an explicit stack instead of recursive calls, the largest partition is pushed first, so the
+    smaller ones are sorted first and the stack never holds more than `O(log(n))` partitions.
+    Partitions smaller than `INSERTION_THRESHOLD` are sorted with insertionsort.
 
     > complexity
     - time: average: `O(n*log(n))`, worst: `O(n**2)`
-    - space: average: `O(log(n))`, worst: `O(n)`
+    - space: `O(log(n))`
     - `n`: length of `array`
 
     > parameters
     - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
     - `return`: `array` sorted
     """
-
-    def rec(array: list[float], left: int, right: int):
-        if left >= right:
-            return
+    if fast:
+        array.sort()
+        return array
+    stack = [(0, len(array) - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left < INSERTION_THRESHOLD:
+            insertionsort_range(array, left, right)
+            continue
         pivot_index = (left + right) // 2
         array[right], array[pivot_index] = array[pivot_index], array[right]
         pivot = array[right]
@@ -68,31 +102,98 @@ def quicksort_lomuto(array: list[float]) -> list[float]:
                 array[left_index], array[center_index] = array[center_index], array[left_index]
                 left_index += 1
         array[left_index], array[right] = array[right], array[left_index]
-        rec(array, left, left_index - 1)
-        rec(array, left_index + 1, right)
+        if left_index - left < right - left_index:
+            stack.append((left_index + 1, right))
+            stack.append((left, left_index - 1))
+        else:
+            stack.append((left, left_index - 1))
+            stack.append((left_index + 1, right))
+    return array
+
+
+def quicksort_three_way(array: list[float], fast: bool = False) -> list[float]:
+    """
+    Sort `array` using quicksort with three-way (dutch national flag) partition algorithm.
+    The center element is used as pivot.
+    Values are partitioned in smaller than, equal to and greater than the pivot, values equal to the pivot are already
+    in place, so only the smaller and greater partitions are sorted, which is faster for arrays with many duplicates.
+    Partitions are kept in an explicit stack instead of recursive calls, the largest partition is pushed first, so the
+    smaller ones are sorted first and the stack never holds more than `O(log(n))` partitions.
+    Partitions smaller than `INSERTION_THRESHOLD` are sorted with insertionsort.
+
+    > complexity
+    - time: average: `O(n*log(u))`, worst: `O(n**2)`
+    - space: average: `O(log(u))`, worst: `O(log(n))`
+    - `n`: length of `array`
+    - `u`: number of distinct values in `array`
 
-    rec(array, 0, len(array) - 1)
+    > parameters
+    - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
+    - `return`: `array` sorted
+    """
+    if fast:
+        array.sort()
+        return array
+    stack = [(0, len(array) - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left < INSERTION_THRESHOLD:
+            insertionsort_range(array, left, right)
+            continue
+        pivot = array[(left + right) // 2]
+        left_index = left
+        center_index = left
+        right_index = right
+        while center_index <= right_index:
+            value = array[center_index]
+            if value < pivot:
+                array[center_index] = array[left_index]
+                array[left_index] = value
+                left_index += 1
+                center_index += 1
+            elif value > pivot:
+                array[center_index] = array[right_index]
+                array[right_index] = value
+                right_index -= 1
+            else:
+                center_index += 1
+        if left_index - left < right - right_index:
+            stack.append((right_index + 1, right))
+            stack.append((left, left_index - 1))
+        else:
+            stack.append((left, left_index - 1))
+            stack.append((right_index + 1, right))
     return array
 
 
-def quicksort_dual_pivot(array: list[float]) -> list[float]:
+def quicksort_dual_pivot(array: list[float], fast: bool = False) -> list[float]:
     """
     Sort `array` using quicksort with dual pivot partition algorithm.
     The the elements in first and second thirds are used as pivots.
+    Partitions are kept in an explicit stack instead of recursive calls, the largest partition is pushed first, so the
+    smaller ones are sorted first and the stack never holds more than `O(log(n))` partitions.
+    Partitions smaller than `INSERTION_THRESHOLD` are sorted with insertionsort.
 
     > complexity
     - time: average: `O(n*log(n))`, worst: `O(n**2)`
-    - space: average: `O(log(n))`, worst: `O(n)`
+    - space: `O(log(n))`
     - `n`: length of `array`
 
     > parameters
     - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
     - `return`: `array` sorted
     """
-
-    def rec(array: list[float], left: int, right: int):
-        if left >= right:
-            return
+    if fast:
+        array.sort()
+        return array
+    stack = [(0, len(array) - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left < INSERTION_THRESHOLD:
+            insertionsort_range(array, left, right)
+            continue
         third = (right - left) / 3
         left_pivot_index = left + math.floor(third)
         right_pivot_index = left + math.ceil(third * 2)
@@ -119,11 +220,12 @@ def quicksort_dual_pivot(array: list[float]) -> list[float]:
         right_index += 1
         array[left], array[left_index] = array[left_index], array[left]
         array[right], array[right_index] = array[right_index], array[right]
-        rec(array, left, left_index - 1)
-        rec(array, left_index + 1, right_index - 1)
-        rec(array, right_index + 1, right)
-
-    rec(array, 0, len(array) - 1)
+        stack.extend(
+            sorted(
+                ((left, left_index - 1), (left_index + 1, right_index - 1), (right_index + 1, right)),
+                key=lambda partition: partition[0] - partition[1],
+            )
+        )
     return array
 
 
@@ -135,6 +237,8 @@ def test():
             ("     quicksort hoare", quicksort_hoare),
             ("    quicksort lomuto", quicksort_lomuto),
             ("quicksort dual pivot", quicksort_dual_pivot),
+            (" quicksort three way", quicksort_three_way),
+            ("      quicksort fast", lambda array: quicksort_hoare(array, True)),
         ),
     )
 
@@ -1,8 +1,9 @@
+import itertools
 import math
 from typing import Any, Optional, cast
 
 
-def radixsort_lsd(array: list[int], block: Optional[int] = None) -> list[int]:
+def radixsort_lsd(array: list[int], block: Optional[int] = None, fast: bool = False) -> list[int]:
     """
     Sort `array` using Least-Significant-Digit radixsort.
     This implementation only supports integer values.
@@ -11,48 +12,36 @@ def radixsort_lsd(array: list[int], block: Optional[int] = None) -> list[int]:
     The `block` parameter is used to define the radix `base`, which is `2**block`.
     The `word` size in binary representation (or when `base` = 2) is `word = log(value_range, 2)`.
     The `word` size is smaller for increasing `base` sizes, `word = log(value_range, base)`.
-    `word` size is also exactly the amount of internal countingsort calls.
+    `word` size is also exactly the amount of passes over the values.
 
+    Values are offset by the minimum value once, so digits are extracted with a shift and a mask.
+    Each pass distributes the values into `base` buckets in a single scan, which keeps the sort stable, and joins the
+    buckets in C, instead of the countingsort frequency, prefix sum and scatter loops.
+
+    Each pass scans `n` values and creates and joins `base` buckets, costing `O(n + base)`.
     Linear complexity is achieved when `n` (array length) is approximately `base`, meaning `block = ceil(log(n, 2))`.
-    By having `base` ~ `n`, the asymptotic complexity of countingsort calls do not increase
-    (`k` = `base`, `k` ~ `n`, then `O(n + k)` is still `O(n)`), also the number of countingsort calls will be
-    `log(value_range, n)`, which tends to 1 when `n` tends to infinity.
+    By having `base` ~ `n`, the cost of each bucket pass does not increase (`O(n + base)` is still `O(n)`), also the
+    number of bucket passes will be `log(value_range, n)`, which tends to 1 when `n` tends to infinity.
 
-    For most cases, the default `block` will provide the best performance, but for a `value_range` much smaller than
-    `n`, a smaller `block` size may provide better performance.
+    In practice, creating `base` bucket lists on every pass is expensive, so for large arrays a fixed `block` of about
+    `8` (check `radixsort_lsd_bytes`) is usually faster than the default, and for a `value_range` much smaller than `n`,
+    a smaller `block` size may provide better performance.
 
     > complexity
-    - time: `O(n * w)`
-    - space: `O(n + w)`
+    - time: `O((n + 2**block) * w)`
+    - space: `O(n + 2**block)`
     - `n`: length of `array`
     - `w`: `log(value_range, 2**block)`
 
     > parameters
     - `array`: array to be sorted
     - `block`: the amount of bits to use as radix, defaults to the number of bits needed to represent `array` length
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
     - `return`: `array` sorted
     """
-
-    def radix_countingsort(array: list[int], output: list[int], base: int, block: int, index: int, min_value: int):
-        """
-        Countingsort implementation for radixsort lsd partial subsort.
-        This implementation partially sorts the array using the provided mask region.
-        This implementation is modified to reuse the same arrays in consecutive calls and reduce memory allocation.
-        The last loop is reversed to maintain the stable property, preserving the least significant digits ordering from
-        previous iterations.
-        """
-        shift = index * block
-        radix = (base - 1) << shift
-        frequencies = [0] * base
-        for value in array:
-            frequencies[(value - min_value & radix) >> shift] += 1
-        for i in range(1, len(frequencies)):
-            frequencies[i] += frequencies[i - 1]
-        for value in reversed(array):
-            masked = (value - min_value & radix) >> shift
-            output[frequencies[masked] - 1] = value
-            frequencies[masked] -= 1
-
+    if fast:
+        array.sort()
+        return array
     if len(array) == 0:
         return array
     min_value = min(array)
@@ -61,17 +50,43 @@ def radixsort_lsd(array: list[int], block: Optional[int] = None) -> list[int]:
     block = max(block if block is not None else math.ceil(math.log2(max(len(array), 1))), 1)
     base = 2 ** block
     word = math.ceil(math.log(max(value_range, 2), base))
-    input = array
-    output = [0] * len(array)
+    mask = base - 1
+    values = [value - min_value for value in array]
     for i in range(word):
-        radix_countingsort(input, output, base, block, i, min_value)
-        input, output = output, input
-    if array != input:
-        array[:] = input
+        shift = i * block
+        buckets: list[list[int]] = [[] for _ in range(base)]
+        for value in values:
+            buckets[value >> shift & mask].append(value)
+        values = list(itertools.chain.from_iterable(buckets))
+    array[:] = [value + min_value for value in values]
     return array
 
 
-def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
+def radixsort_lsd_bytes(array: list[int], fast: bool = False) -> list[int]:
+    """
+    Sort `array` using Least-Significant-Digit radixsort with byte-sized digits.
+    Check `radixsort_lsd`, `block` is fixed to `8`, so each pass distributes the values into `256` buckets and the
+    number of passes is the number of bytes needed to represent the value range, `4` for 32-bit and `8` for 64-bit.
+    Buckets are created on every pass, so the default `block` of `radixsort_lsd`, which grows with `n`, pays for many
+    more buckets than the passes it saves, byte-sized digits are usually faster for large arrays.
+
+    > complexity
+    - time: `O((n + 256) * w)`
+    - space: `O(n + 256)`
+    - `n`: length of `array`
+    - `w`: `log(value_range, 256)`
+
+    > parameters
+    - `array`: array to be sorted
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
+    - `return`: `array` sorted
+    """
+    return radixsort_lsd(array, 8, fast)
+
+
+def radixsort_msd(
+    array: list[int], block: int = 4, fast: bool = False, buffer: Optional[list[int]] = None
+) -> list[int]:
     """
     Sort `array` using Most-Significant-Digit radixsort.
     This implementation only supports integer values.
@@ -105,6 +120,8 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
     > parameters
     - `array`: array to be sorted
     - `block`: the amount of bits to use as radix, defaults to 4
+    - `fast`: sort with `list.sort` instead, CPython's timsort implemented in C
+    - `buffer`: scratch list to reuse between calls, extended to the length of `array` if shorter, defaults to a new one
     - `return`: `array` sorted
     """
 
@@ -117,19 +134,19 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
         This implementation is modified to reuse the same arrays in consecutive calls and reduce memory allocation.
         Only the section between first and last is ordered.
         The accumulated frequencies are returned to reused as indices for recursive calls.
+        Digits are extracted once into a list and reused by the counting and scatter loops, the prefix sum runs in C.
         """
         shift = index * block
-        radix = (base - 1) << shift
+        mask = base - 1
+        values = array[first : last + 1]
+        digits = [value - min_value >> shift & mask for value in values]
         frequencies = [0] * base
-        for i in range(first, last + 1):
-            frequencies[(array[i] - min_value & radix) >> shift] += 1
-        for i in range(1, len(frequencies)):
-            frequencies[i] += frequencies[i - 1]
-        for i in range(first, last + 1):
-            value = array[i]
-            masked = (value - min_value & radix) >> shift
-            output[first + frequencies[masked] - 1] = value
-            frequencies[masked] -= 1
+        for digit in digits:
+            frequencies[digit] += 1
+        frequencies = list(itertools.accumulate(frequencies))
+        for value, digit in zip(values, digits):
+            frequencies[digit] -= 1
+            output[first + frequencies[digit]] = value
         return frequencies
 
     def rec(
@@ -143,7 +160,7 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
         min_value: int,
     ):
         frequencies = radix_countingsort(input, output, first, last, base, block, word_remaining, min_value)
-        input[first : last + 1] = (output[i] for i in range(first, last + 1))
+        input[first : last + 1] = output[first : last + 1]
         word_remaining -= 1
         if word_remaining < 0:
             return
@@ -153,6 +170,9 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
             if next_first < next_last:
                 rec(input, output, next_first, next_last, base, block, word_remaining, min_value)
 
+    if fast:
+        array.sort()
+        return array
     if len(array) == 0:
         return array
     min_value = min(array)
@@ -162,7 +182,8 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
     base = 2 ** block
     word = math.ceil(math.log(max(value_range, 2), base))
     input = array
-    output = [0] * len(array)
+    output = buffer if buffer is not None else []
+    output.extend([0] * (len(array) - len(output)))
     rec(input, output, 0, len(array) - 1, base, block, word - 1, min_value)
     return array
 
@@ -170,6 +191,7 @@ def radixsort_msd(array: list[int], block: int = 4) -> list[int]:
 def test():
     from ..test import sort_benchmark
 
+    scratch: list[int] = []
     sort_benchmark(
         (
             ("radixsort lsd block=1", lambda array: cast(Any, radixsort_lsd)(array, 1)),
@@ -179,12 +201,15 @@ def test():
             ("radixsort lsd block=5", lambda array: cast(Any, radixsort_lsd)(array, 5)),
             ("radixsort lsd block=6", lambda array: cast(Any, radixsort_lsd)(array, 6)),
             ("radixsort lsd block=n", lambda array: cast(Any, radixsort_lsd)(array, None)),
+            ("  radixsort lsd bytes", cast(Any, radixsort_lsd_bytes)),
             ("radixsort msd block=1", lambda array: cast(Any, radixsort_msd)(array, 1)),
             ("radixsort msd block=2", lambda array: cast(Any, radixsort_msd)(array, 2)),
             ("radixsort msd block=3", lambda array: cast(Any, radixsort_msd)(array, 3)),
             ("radixsort msd block=4", lambda array: cast(Any, radixsort_msd)(array, 4)),
             ("radixsort msd block=5", lambda array: cast(Any, radixsort_msd)(array, 5)),
             ("radixsort msd block=6", lambda array: cast(Any, radixsort_msd)(array, 6)),
+            ("radixsort msd buffer ", lambda array: cast(Any, radixsort_msd)(array, buffer=scratch)),
+            ("       radixsort fast", lambda array: cast(Any, radixsort_lsd)(array, fast=True)),
         ),
     )
 
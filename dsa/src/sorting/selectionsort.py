@@ -1,6 +1,7 @@
 def selectionsort(array: list[float]) -> list[float]:
     """
     Sort `array` using selectionsort.
+    The smallest value found is kept in a local variable, so each comparison indexes `array` only once.
 
     > complexity
     - time: `O(n**2)`
@@ -11,12 +12,16 @@ def selectionsort(array: list[float]) -> list[float]:
     - `array`: array to be sorted
     - `return`: `array` sorted
     """
-    for i in range(0, len(array)):
+    length = len(array)
+    for i in range(length):
         k = i
-        for j in range(i + 1, len(array)):
-            if array[j] < array[k]:
+        smallest = array[i]
+        for j in range(i + 1, length):
+            if array[j] < smallest:
                 k = j
-        array[i], array[k] = array[k], array[i]
+                smallest = array[j]
+        array[k] = array[i]
+        array[i] = smallest
     return array
 
 
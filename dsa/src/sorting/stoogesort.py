@@ -1,6 +1,3 @@
-import math
-
-
 def stoogesort(array: list[float]) -> list[float]:
     """
     Sort `array` using stoogesort.
@@ -18,12 +15,13 @@ def stoogesort(array: list[float]) -> list[float]:
     def rec(array: list[float], first: int, last: int):
         if array[first] > array[last]:
             array[first], array[last] = array[last], array[first]
-        if last - first + 1 <= 2:
+        length = last - first + 1
+        if length <= 2:
             return
-        third = (last - first + 1) / 3
-        rec(array, first, math.ceil(last - third))
-        rec(array, math.floor(first + third), last)
-        rec(array, first, math.ceil(last - third))
+        third = length // 3
+        rec(array, first, last - third)
+        rec(array, first + third, last)
+        rec(array, first, last - third)
 
     if len(array) == 0:
         return array
@@ -138,6 +138,8 @@ def read(
 
     If a file is provided, it is assumed to use the `utf-8` encoding.
     An immutable `mmap.mmap` is returned (works like `bytearray`).
+    Searches scan the file from start to end, so where `madvise` is available, the kernel is advised of sequential
+    access, allowing larger readaheads. If the file is truncated while mapped, reading past its new end raises `SIGBUS`.
 
     If a string is provided, it is converted to `bytes` using `utf-8` encoding (requires copying).
 
@@ -150,9 +152,15 @@ def read(
     if path is not None:
         reader = open(path, "rb")
         mm = mmap.mmap(reader.fileno(), 0, prot=mmap.PROT_READ)
+        for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+            if hasattr(mmap, advice):
+                try:
+                    mm.madvise(getattr(mmap, advice))
+                except OSError:
+                    pass
         return mm, lambda: (mm.close(), reader.close())
     if string is not None:
-        return bytes(string, "utf-8"), lambda: ()
+        return string.encode("utf-8"), lambda: ()
     if byte is not None:
         return byte, lambda: ()
     raise Exception("no source was provided")